@@ -2,6 +2,7 @@
 
 import re
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk, messagebox
 from typing import Optional, Tuple
 
@@ -15,12 +16,15 @@ from sympy.parsing.sympy_parser import (
 from DataTransform import DataTransformer, identify_required_transformations
 from Equations import *
 from LineaX_Classes import ScientificEquation, InputData
-from LinearGraphDisplay import LinearGraphResultsScreen
-from AutomatedGraphDisplay import AutomatedGraphResultsScreen
 from ManagingScreens import ScreenManager, make_scrollable
 
 TRANSFORMS = standard_transformations + (implicit_multiplication_application,)
 
+# Placeholder symbols that the chosen x and y variables are mapped onto during
+# linearisation, plus the stand-in used when solving y**n = f(x).
+_X_TEMP, _Y_TEMP = sp.symbols("__linx__ __liny__")
+_Y_SUB = sp.Symbol('_ysub_tmp_')
+
 _GREEK_REPLACEMENTS = {
     "lambda": "lambda_", "Lambda": "lambda_",
     "mu": "mu", "sigma": "sigma", "theta": "theta", "phi": "phi", "rho": "rho",
@@ -37,6 +41,31 @@ _GREEK_DISPLAY_DESCRIPTIONS = {
     "h": "height or Planck constant",
 }
 
+# Variables conventionally plotted on the x-axis (independent) or y-axis (dependent);
+# used by _score_result to prefer the more natural of the two axis assignments.
+_INDEPENDENT_VARS = frozenset({'t', 'x', 's', 'r', 'd', 'f', 'λ', 'θ', 'φ', 'ω', 'I', 'h', 'L', 'A'})
+_DEPENDENT_VARS   = frozenset({'v', 'V', 'F', 'E', 'p', 'A', 'N', 'Q', 'P', 'T', 'W', 'R'})
+
+# Gradient units inferred from the equation name or the gradient's symbol, checked in
+# order: (name keyword, symbol in gradient meaning, units).
+_GRADIENT_UNIT_HINTS = (
+    ("decay", "λ", "s⁻¹"),
+    ("attenuation", "μ", "m⁻¹"),
+)
+
+# Matches either a '**' power operator or a whitespace run, so _format_expr can
+# render '^' and normalise spacing in a single substitution pass.
+_POW_OR_SPACE_RE = re.compile(r"\*\*|\s+")
+
+# x-axis power transform labels in priority order: a reciprocal takes precedence
+# over any positive power also present on the linearised RHS.
+_X_POWER_LABELS = (
+    (-1, "1/{}"),
+    (2, "{}²"),
+    (3, "{}³"),
+    (4, "{}⁴"),
+)
+
 
 def _apply_greek_replacements(text: str) -> str:
     """Replace Greek letter representations with SymPy-safe ASCII forms."""
@@ -45,6 +74,257 @@ def _apply_greek_replacements(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=128)
+def _pretty_eq(equation: sp.Eq) -> str:
+    """Return the Unicode pretty-printed form of an equation, memoised per expression."""
+    return sp.pretty(equation, use_unicode=True)
+
+
+def _score_result(result) -> float:
+    """Score a linearisation attempt; lower is better, failed attempts score infinity.
+
+    Booleans are used as 0/1 multipliers so the score is a single branchless expression.
+    """
+    if not result:
+        return float('inf')
+    _, x_var, y_var, x_transform, y_transform, _, _ = result
+    x_tx = x_transform != x_var
+    y_tx = y_transform != y_var
+    return (10 * (x_tx and y_tx) + 2 * (x_tx ^ y_tx) - y_tx + 2 * x_tx
+            - 2 * (x_var in _INDEPENDENT_VARS) - 2 * (y_var in _DEPENDENT_VARS)
+            + 3 * (x_var in _DEPENDENT_VARS) + 3 * (y_var in _INDEPENDENT_VARS))
+
+
+@lru_cache(maxsize=512)
+def _linearise(equation: sp.Eq) -> sp.Eq:
+    """Transform a SymPy equation into y = mx + c linear form (Algorithm 2).
+
+    SymPy expressions are hashable, so results are memoised: re-linearising the same
+    equation while the user tries different variable selections is a cache lookup.
+    """
+    x, y = _X_TEMP, _Y_TEMP
+    if not isinstance(equation, sp.Eq):
+        expr = equation
+        # The cheap structural checks short-circuit before free_symbols is materialised.
+        if expr.is_Add or expr.is_Mul or expr.is_Pow or y not in expr.free_symbols:
+            equation = sp.Eq(y, expr)
+        else:
+            equation = sp.Eq(expr, 0)
+
+    lhs, rhs = equation.lhs, equation.rhs
+    if y in lhs.free_symbols and y not in rhs.free_symbols:
+        y_side, expr_side = lhs, rhs
+    elif y in rhs.free_symbols and y not in lhs.free_symbols:
+        y_side, expr_side = rhs, lhs
+    else:
+        return equation
+
+    # Pre-check: y**n = linear_in_x pattern (must run before the already-linear branch)
+    for _pw in (2, 3, 4):
+        _y_power = y ** _pw
+        if equation.has(_y_power):
+            _y_sub = _Y_SUB
+            _eq_sub = equation.subs(_y_power, _y_sub)
+            if y not in _eq_sub.free_symbols:
+                try:
+                    _sols = sp.solve(_eq_sub, _y_sub)
+                    if _sols:
+                        _cand = sp.expand(_sols[0])
+                        if _cand.is_polynomial(x) and sp.degree(_cand, x) <= 1:
+                            return sp.Eq(_y_power, _cand)
+                except Exception:
+                    pass
+
+    # Both branches below need y isolated when it is not already alone on one side,
+    # so sp.solve is run once here and its result shared.
+    solved = []
+    if y_side != y:
+        try:
+            solved = sp.solve(equation, y)
+        except Exception:
+            pass
+
+    if expr_side.is_polynomial(x) and sp.degree(expr_side, x) <= 1:
+        if y_side == y:
+            return equation
+        if solved:
+            return sp.Eq(y, solved[0])
+        return sp.Eq(y_side, expr_side)
+
+    if solved:
+        expr_side = solved[0]
+        y_side = y
+
+    if expr_side.has(sp.exp):
+        exp_terms = [t for t in sp.preorder_traversal(expr_side) if isinstance(t, sp.exp)]
+        if exp_terms:
+            exp_term = exp_terms[0]
+            try:
+                coefficient = sp.simplify(expr_side / exp_term)
+                return sp.Eq(sp.log(y_side), sp.log(coefficient) + exp_term.args[0])
+            except Exception:
+                pass
+
+    return sp.Eq(y_side, expr_side)
+
+
+def _is_trivially_linear(equation) -> bool:
+    """Return True if a mapped equation is already y = (expression linear in x).
+
+    Such equations are returned unchanged by _linearise, so the call can be skipped.
+    Equations containing exp/log, or where degree() cannot be determined, return False.
+    """
+    x, y = _X_TEMP, _Y_TEMP
+    if not isinstance(equation, sp.Eq) or equation.lhs != y:
+        return False
+    rhs = equation.rhs
+    try:
+        return (y not in rhs.free_symbols and not rhs.atoms(sp.exp, sp.log)
+                and rhs.is_polynomial(x) and sp.degree(rhs, x) <= 1)
+    except Exception:
+        return False
+
+
+def _equation_key(equation) -> tuple:
+    """Return a hashable stand-in for an Equation, whose dict fields make it unhashable."""
+    return (equation.name, equation.linearisation_type,
+            frozenset((equation.transform_info or {}).items()))
+
+
+@lru_cache(maxsize=256)
+def _identify_transforms_cached(linearised_eq: sp.Eq, x_var: str, y_var: str) -> Tuple[str, str]:
+    """Inspect a linearised equation to determine axis transformation labels."""
+    x_temp, y_temp = _X_TEMP, _Y_TEMP
+    x_transform, y_transform = x_var, y_var
+    lhs, rhs = linearised_eq.lhs, linearised_eq.rhs
+
+    # One atoms() scan per side collects every exponent applied directly to the
+    # axis variable, replacing a separate has(var ** n) tree walk per candidate power.
+    y_exponents = {term.exp for term in lhs.atoms(sp.Pow) if term.base == y_temp}
+    x_exponents = {term.exp for term in rhs.atoms(sp.Pow) if term.base == x_temp}
+
+    if lhs.has(sp.log):
+        if lhs == sp.log(y_temp) or lhs.func == sp.log:
+            y_transform = f"ln({y_var})"
+    elif lhs != y_temp and lhs.has(y_temp) and 2 not in y_exponents:
+        try:
+            y_transform = str(lhs.subs(y_temp, sp.Symbol(y_var)))
+        except Exception:
+            y_transform = y_var
+
+    if 2 in y_exponents:
+        y_transform = f"{y_var}**2"
+    elif 3 in y_exponents:
+        y_transform = f"{y_var}**3"
+
+    if any(x_temp in term.free_symbols for term in rhs.atoms(sp.log)):
+        x_transform = f"ln({x_var})"
+    power_label = next((label for exp, label in _X_POWER_LABELS if exp in x_exponents), None)
+    if power_label is not None:
+        x_transform = power_label.format(x_var)
+    return x_transform, y_transform
+
+
+@lru_cache(maxsize=256)
+def _format_expr(expr: sp.Expr, split_fraction: bool = False) -> str:
+    """Return a display string for a gradient or intercept coefficient.
+
+    Coefficients arrive already canonical from coeff() on the expanded RHS, so no
+    sp.simplify pass is needed. With split_fraction, a product containing negative
+    powers is shown as 'numerator/denominator'. '**' is shown as '^' and whitespace
+    is normalised.
+    """
+    text = None
+    if split_fraction and isinstance(expr, sp.Mul):
+        numer_factors = []
+        denom_factors = []
+        for factor in sp.Mul.make_args(expr):
+            if isinstance(factor, sp.Pow) and factor.exp < 0:
+                denom_factors.append(factor.base)
+            else:
+                numer_factors.append(factor)
+        if denom_factors:
+            numer_str = '*'.join(map(str, numer_factors)) if numer_factors else '1'
+            text = f"{numer_str}/{'*'.join(map(str, denom_factors))}"
+    if text is None:
+        text = str(expr)
+    return _POW_OR_SPACE_RE.sub(lambda m: '^' if m.group() == '**' else ' ', text).strip()
+
+
+@lru_cache(maxsize=256)
+def _identify_meanings_cached(linearised_eq: sp.Eq, original_key: tuple, x_var: str,
+                              y_var: str, find_var: Optional[str]) -> Tuple[str, str]:
+    """Extract physical meanings of the gradient and intercept from a linearised equation.
+
+    original_key is the hashable form of the source Equation produced by _equation_key.
+    """
+    _, linearisation_type, transform_items = original_key
+    transform_info = dict(transform_items)
+    # Catalogue exponential equations supply both meanings, which overwrite whatever
+    # is derived below; unless the find-variable annotation needs the symbolic
+    # coefficients, skip deriving them.
+    if (linearisation_type == "exponential" and not find_var
+            and "gradient_meaning" in transform_info and "intercept_meaning" in transform_info):
+        return transform_info["gradient_meaning"], transform_info["intercept_meaning"]
+    x_temp, y_temp = _X_TEMP, _Y_TEMP
+    rhs = linearised_eq.rhs
+    try:
+        if rhs.has(1 / x_temp):
+            try:
+                grad_coeff = rhs.coeff(1 / x_temp, 1)
+                if not grad_coeff:
+                    grad_coeff = sp.simplify(rhs * x_temp)
+            except Exception:
+                try:
+                    rhs_fraction = sp.together(rhs)
+                    numer, denom = sp.fraction(rhs_fraction)
+                    if x_temp in denom.free_symbols:
+                        grad_coeff = sp.simplify(numer / (denom / x_temp))
+                    else:
+                        grad_coeff = sp.simplify(rhs * x_temp)
+                except Exception:
+                    grad_coeff = sp.simplify(rhs * x_temp)
+            const_term = sp.Integer(0)
+        else:
+            # A RHS with no Add nested below its top level (e.g. a*x + b) is already
+            # expanded, so the full sp.expand pass is only run when something can distribute.
+            rhs_expanded = rhs
+            if any(term.has(sp.Add) for term in sp.Add.make_args(rhs)):
+                rhs_expanded = sp.expand(rhs)
+            grad_coeff = rhs_expanded.coeff(x_temp, 1) or sp.Integer(0)
+            const_term = rhs_expanded.coeff(x_temp, 0) or sp.Integer(0)
+
+        reverse_map = {x_temp: sp.Symbol(x_var), y_temp: sp.Symbol(y_var)}
+        # is_zero is an assumption lookup; None (unknown) is treated as non-zero, as
+        # a structural != 0 comparison would.
+        grad_coeff_original = grad_coeff if grad_coeff.is_zero else grad_coeff.subs(reverse_map)
+        const_term_original = const_term if const_term.is_zero else const_term.subs(reverse_map)
+
+        grad_meaning = "0" if grad_coeff_original.is_zero else _format_expr(grad_coeff_original, split_fraction=True)
+        int_meaning = "0" if const_term_original.is_zero else _format_expr(const_term_original)
+
+        if linearisation_type == "exponential" and transform_info:
+            grad_meaning = transform_info.get("gradient_meaning", grad_meaning)
+            int_meaning  = transform_info.get("intercept_meaning", int_meaning)
+
+        if find_var:
+            if find_var in str(grad_coeff_original):
+                grad_meaning += f" (contains {find_var})"
+            if find_var in str(const_term_original):
+                int_meaning  += f" (contains {find_var})"
+        return grad_meaning, int_meaning
+    except Exception as e:
+        print(f"Error in _identify_meanings: {e}")
+        grad_meaning = "gradient"
+        int_meaning  = "y-intercept"
+        if linearisation_type == "exponential" and transform_info:
+            grad_meaning = transform_info.get("gradient_meaning", "gradient")
+            int_meaning  = transform_info.get("intercept_meaning", "y-intercept")
+        if find_var:
+            int_meaning += f" (can be used to find {find_var})"
+        return grad_meaning, int_meaning
+
+
 class AnalysisMethodScreen(tk.Frame):
     """Screen 2: equation selection and linearisation (linear path) or model card selection (automated path)."""
 
@@ -55,6 +335,14 @@ class AnalysisMethodScreen(tk.Frame):
         self.selected_equation: Optional[Equation] = None
         self.scientific_equation: Optional[ScientificEquation] = None
         self.selected_vars: set = set()
+        # Maps each clickable variable token to its Button(s) on the equation canvas.
+        self._var_buttons: dict = {}
+        # Last options pushed to the find_var Combobox; unchanged options skip the Tcl update.
+        self._last_find_var_state: tuple = ()
+        # Linearisation attempts keyed on (equation, x_var, y_var, find_var); cleared per equation.
+        self._attempt_cache: dict = {}
+        # SymPy Symbols by name, built lazily by _sym.
+        self._symbol_cache: dict = {}
         self.raw_data: Optional[InputData] = None
         self.transformed_data: Optional[InputData] = None
         self.data_transformer: Optional[DataTransformer] = None
@@ -206,6 +494,9 @@ class AnalysisMethodScreen(tk.Frame):
         if self.raw_data is None:
             messagebox.showwarning("No Data", "Please go back and input your data first.")
             return
+        # The graph screens are imported on navigation so Matplotlib and SciPy load only
+        # once a graph is requested, not when Screen 2 is first shown.
+        from AutomatedGraphDisplay import AutomatedGraphResultsScreen
         self.manager.show(AutomatedGraphResultsScreen)
 
     def _on_search(self, event):
@@ -255,6 +546,8 @@ class AnalysisMethodScreen(tk.Frame):
                 variables = {var: _GREEK_DISPLAY_DESCRIPTIONS.get(var, var) for var in all_vars}
                 self.selected_equation = Equation("Custom Equation", equation_str, variables, linearisation_type="custom")
                 self.selected_vars.clear()
+                self._last_find_var_state = ()
+                self._attempt_cache.clear()
                 self.scientific_equation = ScientificEquation(equation_str)
                 self.linearised_display_frame.pack_forget()
                 self.constants_frame.pack_forget()
@@ -282,6 +575,8 @@ class AnalysisMethodScreen(tk.Frame):
                 self.selected_equation = eq
                 break
         self.selected_vars.clear()
+        self._last_find_var_state = ()
+        self._attempt_cache.clear()
         self.scientific_equation = ScientificEquation(self.selected_equation.expression)
         self.linearised_display_frame.pack_forget()
         self.constants_frame.pack_forget()
@@ -292,6 +587,10 @@ class AnalysisMethodScreen(tk.Frame):
     def _display_clickable_equation(self):
         """Render the selected equation with variable tokens as clickable buttons."""
         self.equation_canvas.delete("all")
+        for buttons in self._var_buttons.values():
+            for btn in buttons:
+                btn.destroy()
+        self._var_buttons = {}
         if not self.selected_equation:
             return
         expr = self.selected_equation.expression
@@ -309,6 +608,7 @@ class AnalysisMethodScreen(tk.Frame):
                 btn = tk.Button(self.equation_canvas, text=token_stripped, font=("Segoe UI", 11, "bold"),
                                 fg=color, bg=bg_color, relief="raised", borderwidth=2, cursor="hand2",
                                 command=lambda v=token_stripped: self._toggle_variable(v))
+                self._var_buttons.setdefault(token_stripped, []).append(btn)
                 btn_window = self.equation_canvas.create_window(x_pos, y_pos, anchor="w", window=btn)
                 self.equation_canvas.update()
                 bbox = self.equation_canvas.bbox(btn_window)
@@ -332,10 +632,18 @@ class AnalysisMethodScreen(tk.Frame):
                                        "You can only select 2 variables to measure.\nDeselect one first.")
                 return
             self.selected_vars.add(var)
-        self._display_clickable_equation()
+        self._refresh_variable_buttons()
         self._update_selected_vars_display()
         self._update_find_var_options()
 
+    def _refresh_variable_buttons(self):
+        """Recolour the existing variable buttons to match the current selection."""
+        for var, buttons in self._var_buttons.items():
+            is_selected = var in self.selected_vars
+            for btn in buttons:
+                btn.configure(fg="#3b82f6" if is_selected else "#6b7280",
+                              bg="#dbeafe" if is_selected else "#f3f4f6")
+
     def _update_selected_vars_display(self):
         """Refresh the colour-coded label summarising current variable selection."""
         if len(self.selected_vars) == 0:
@@ -420,9 +728,12 @@ class AnalysisMethodScreen(tk.Frame):
     def _update_find_var_options(self):
         if not self.selected_equation:
             return
-        available = [v for v in self.selected_equation.variables if v not in self.selected_vars]
-        self.find_var.config(values=["None"] + available)
+        state = ("None",) + tuple(v for v in self.selected_equation.variables if v not in self.selected_vars)
+        if state == self._last_find_var_state:
+            return
+        self.find_var["values"] = state
         self.find_var.set("None")
+        self._last_find_var_state = state
 
     def _default_constant(self, symbol: str) -> Optional[float]:
         return CONSTANTS.get(symbol)
@@ -454,11 +765,11 @@ class AnalysisMethodScreen(tk.Frame):
             }
             for var in self.selected_equation.variables:
                 clean_var = var.replace("₀", "0").replace("₁", "1")
-                local_dict[clean_var] = sp.Symbol(var)
+                local_dict[clean_var] = self._sym(var)
             local_dict.update({
-                'mu': sp.Symbol('μ'), 'lambda_': sp.Symbol('λ'),
-                'sigma': sp.Symbol('σ'), 'rho': sp.Symbol('ρ'),
-                'theta': sp.Symbol('θ'), 'phi': sp.Symbol('φ'),
+                'mu': self._sym('μ'), 'lambda_': self._sym('λ'),
+                'sigma': self._sym('σ'), 'rho': self._sym('ρ'),
+                'theta': self._sym('θ'), 'phi': self._sym('φ'),
             })
             lhs = parse_expr(lhs_str.strip(), transformations=TRANSFORMS, local_dict=local_dict)
             rhs = parse_expr(rhs_str.strip(), transformations=TRANSFORMS, local_dict=local_dict)
@@ -472,32 +783,7 @@ class AnalysisMethodScreen(tk.Frame):
         result1 = self._attempt_linearisation(equation, var1, var2, find_sym)
         result2 = self._attempt_linearisation(equation, var2, var1, find_sym)
 
-        def score_result(result) -> float:
-            if not result:
-                return float('inf')
-            _, x_var, y_var, x_transform, y_transform, _, _ = result
-            x_is_transformed = x_transform != x_var
-            y_is_transformed = y_transform != y_var
-            score = 0
-            if x_is_transformed and y_is_transformed:
-                score += 10
-            elif not x_is_transformed and not y_is_transformed:
-                score += 0
-            else:
-                score += 2
-            if y_is_transformed:
-                score -= 1
-            if x_is_transformed:
-                score += 2
-            independent_vars = {'t', 'x', 's', 'r', 'd', 'f', 'λ', 'θ', 'φ', 'ω', 'I', 'h', 'L', 'A'}
-            dependent_vars   = {'v', 'V', 'F', 'E', 'p', 'A', 'N', 'Q', 'P', 'T', 'W', 'R'}
-            if x_var in independent_vars: score -= 2
-            if y_var in dependent_vars:   score -= 2
-            if x_var in dependent_vars:   score += 3
-            if y_var in independent_vars: score += 3
-            return score
-
-        result = result1 if score_result(result1) <= score_result(result2) else result2
+        result = result1 if _score_result(result1) <= _score_result(result2) else result2
         if not result:
             messagebox.showinfo("Linearisation Result",
                                 "This equation is already in linear form or doesn't require transformation.")
@@ -538,9 +824,9 @@ class AnalysisMethodScreen(tk.Frame):
             messagebox.showwarning("No Linearised Data", "Please linearise an equation first before generating the graph.")
             return
         if self.selected_equation:
-            gradient_var, gradient_units   = self._extract_coefficient_info("gradient")
-            intercept_var, intercept_units = self._extract_coefficient_info("intercept")
-            find_var = self.find_var.get() if self.find_var.get() != "None" else None
+            gradient_var, gradient_units, intercept_var, intercept_units = self._extract_coefficient_info()
+            find_var = self.find_var.get()
+            find_var = find_var if find_var != "None" else None
             constants: dict = {}
             for var, entry in self.constant_entries.items():
                 value_str = entry.get().strip()
@@ -549,11 +835,11 @@ class AnalysisMethodScreen(tk.Frame):
                         constants[var] = float(value_str)
                     except ValueError:
                         pass
-            measurement_units: dict = {
-                var: entry.get().strip()
-                for var, entry in self.unit_entries.items()
-                if entry.get().strip() and entry.get().strip() != "Units"
-            }
+            # Each entry.get() is a Tcl round-trip, so read every unit entry once.
+            measurement_units: dict = {}
+            for var, entry in self.unit_entries.items():
+                if (unit_str := entry.get().strip()) and unit_str != "Units":
+                    measurement_units[var] = unit_str
             equation_info = {
                 'name': self.selected_equation.name,
                 'equation_expression': self.selected_equation.expression if self.selected_equation else '',
@@ -576,24 +862,20 @@ class AnalysisMethodScreen(tk.Frame):
                 'gradient_meaning': 'm', 'intercept_meaning': 'c',
             }
         self.manager.set_equation_info(equation_info)
+        from LinearGraphDisplay import LinearGraphResultsScreen
         self.manager.show(LinearGraphResultsScreen)
 
-    def _extract_coefficient_info(self, role: str) -> Tuple[str, str]:
-        """Return the variable name and unit string for either the gradient or intercept."""
+    def _extract_coefficient_info(self) -> Tuple[str, str, str, str]:
+        """Return (gradient_var, gradient_units, intercept_var, intercept_units) in one pass."""
         if not self.selected_equation:
-            return ('m', '') if role == "gradient" else ('c', '')
-        if role == "gradient":
-            var = (self.scientific_equation.m_meaning
-                   if self.scientific_equation and self.scientific_equation.m_meaning else 'gradient')
-            units = ''
-            if 'decay' in self.selected_equation.name.lower() or 'λ' in var:
-                units = 's⁻¹'
-            elif 'attenuation' in self.selected_equation.name.lower() or 'μ' in var:
-                units = 'm⁻¹'
-            return var, units
-        var = (self.scientific_equation.c_meaning
-               if self.scientific_equation and self.scientific_equation.c_meaning else 'intercept')
-        return var, ''
+            return 'm', '', 'c', ''
+        sci = self.scientific_equation
+        grad_var = sci.m_meaning if sci and sci.m_meaning else 'gradient'
+        int_var  = sci.c_meaning if sci and sci.c_meaning else 'intercept'
+        name_folded = self.selected_equation.name_folded
+        grad_units = next((u for keyword, symbol, u in _GRADIENT_UNIT_HINTS
+                           if keyword in name_folded or symbol in grad_var), '')
+        return grad_var, grad_units, int_var, ''
 
     def _identify_xy_vars(self) -> Tuple[str, str]:
         vars_list = list(self.selected_vars)
@@ -610,142 +892,58 @@ class AnalysisMethodScreen(tk.Frame):
             self.manager.set_data(self.raw_data)
             messagebox.showinfo("Data Reverted", "Data has been reverted to original raw measurements.")
 
+    def _sym(self, name: str) -> sp.Symbol:
+        """Return the SymPy Symbol for name, constructing it only on first use."""
+        symbol = self._symbol_cache.get(name)
+        if symbol is None:
+            symbol = self._symbol_cache[name] = sp.Symbol(name)
+        return symbol
+
     def _attempt_linearisation(self, equation: sp.Eq, x_var: str, y_var: str,
                                 find_var: Optional[str]) -> Optional[tuple]:
-        """Attempt linearisation with the given x/y variable assignment."""
-        x_temp, y_temp = sp.symbols("__linx__ __liny__")
-        symbol_map = {sp.Symbol(x_var): x_temp, sp.Symbol(y_var): y_temp}
+        """Attempt linearisation with the given x/y variable assignment.
+
+        Results (including failures) are cached in _attempt_cache for the current equation.
+        """
+        key = (equation, x_var, y_var, find_var)
+        if key not in self._attempt_cache:
+            self._attempt_cache[key] = self._compute_linearisation(equation, x_var, y_var, find_var)
+        return self._attempt_cache[key]
+
+    def _compute_linearisation(self, equation: sp.Eq, x_var: str, y_var: str,
+                               find_var: Optional[str]) -> Optional[tuple]:
+        """Uncached body of _attempt_linearisation."""
+        x_temp, y_temp = _X_TEMP, _Y_TEMP
+        symbol_map = {self._sym(x_var): x_temp, self._sym(y_var): y_temp}
         try:
             mapped_eq = equation.subs(symbol_map)
         except Exception:
             return None
         try:
-            linearised = self.linearise(mapped_eq)
+            linearised = mapped_eq if _is_trivially_linear(mapped_eq) else self.linearise(mapped_eq)
         except Exception:
             return None
-        reverse_map = {x_temp: sp.Symbol(x_var), y_temp: sp.Symbol(y_var)}
+        reverse_map = {x_temp: self._sym(x_var), y_temp: self._sym(y_var)}
         linearised_with_original_symbols = linearised.subs(reverse_map)
         x_transform, y_transform = self._identify_transforms(linearised, x_var, y_var)
         grad_meaning, int_meaning = self._identify_meanings(linearised, self.selected_equation, x_var, y_var, find_var)
         return (linearised_with_original_symbols, x_var, y_var, x_transform, y_transform, grad_meaning, int_meaning)
 
     def _identify_transforms(self, linearised_eq: sp.Eq, x_var: str, y_var: str) -> Tuple[str, str]:
-        """Inspect a linearised equation to determine axis transformation labels."""
-        x_temp, y_temp = sp.symbols("__linx__ __liny__")
-        x_transform, y_transform = x_var, y_var
-        lhs, rhs = linearised_eq.lhs, linearised_eq.rhs
-
-        if lhs.has(sp.log):
-            if lhs == sp.log(y_temp) or lhs.func == sp.log:
-                y_transform = f"ln({y_var})"
-        elif lhs != y_temp and lhs.has(y_temp) and not lhs.has(y_temp ** 2):
-            try:
-                y_transform = str(lhs.subs(y_temp, sp.Symbol(y_var)))
-            except Exception:
-                y_transform = y_var
-
-        if lhs == y_temp ** 2 or lhs.has(y_temp ** 2):
-            y_transform = f"{y_var}**2"
-        elif lhs == y_temp ** 3 or lhs.has(y_temp ** 3):
-            y_transform = f"{y_var}**3"
-
-        if rhs.has(sp.log):
-            for arg in sp.preorder_traversal(rhs):
-                if isinstance(arg, sp.log) and arg.has(x_temp):
-                    x_transform = f"ln({x_var})"
-                    break
-        if rhs.has(x_temp ** 2) and not rhs.has(1 / x_temp):
-            x_transform = f"{x_var}²"
-        elif rhs.has(x_temp ** 3):
-            x_transform = f"{x_var}³"
-        elif rhs.has(x_temp ** 4):
-            x_transform = f"{x_var}⁴"
-        if rhs.has(1 / x_temp):
-            x_transform = f"1/{x_var}"
-        return x_transform, y_transform
+        """Inspect a linearised equation to determine axis transformation labels (memoised)."""
+        return _identify_transforms_cached(linearised_eq, x_var, y_var)
 
     def _identify_meanings(self, linearised_eq: sp.Eq, original_eq, x_var: str,
                            y_var: str, find_var: Optional[str]) -> Tuple[str, str]:
-        """Extract physical meanings of the gradient and intercept from a linearised equation."""
-        x_temp, y_temp = sp.symbols("__linx__ __liny__")
-        rhs = linearised_eq.rhs
-        rhs_expanded = sp.expand(rhs)
-        try:
-            if rhs.has(1 / x_temp):
-                try:
-                    grad_coeff = rhs.coeff(1 / x_temp, 1)
-                    if not grad_coeff:
-                        grad_coeff = sp.simplify(rhs * x_temp)
-                except Exception:
-                    try:
-                        rhs_fraction = sp.together(rhs)
-                        numer, denom = sp.fraction(rhs_fraction)
-                        if x_temp in denom.free_symbols:
-                            grad_coeff = sp.simplify(numer / (denom / x_temp))
-                        else:
-                            grad_coeff = sp.simplify(rhs * x_temp)
-                    except Exception:
-                        grad_coeff = sp.simplify(rhs * x_temp)
-                const_term = sp.Integer(0)
-            else:
-                grad_coeff = rhs_expanded.coeff(x_temp, 1) or sp.Integer(0)
-                const_term = rhs_expanded.coeff(x_temp, 0) or sp.Integer(0)
-
-            reverse_map = {x_temp: sp.Symbol(x_var), y_temp: sp.Symbol(y_var)}
-            grad_coeff_original = grad_coeff.subs(reverse_map) if grad_coeff != 0 else grad_coeff
-            const_term_original = const_term.subs(reverse_map) if const_term != 0 else const_term
-
-            if grad_coeff_original != 0:
-                grad_simplified = sp.simplify(grad_coeff_original)
-                if isinstance(grad_simplified, sp.Mul):
-                    numer_factors = []
-                    denom_factors = []
-                    for factor in sp.Mul.make_args(grad_simplified):
-                        if isinstance(factor, sp.Pow) and factor.exp < 0:
-                            denom_factors.append(factor.base)
-                        else:
-                            numer_factors.append(factor)
-                    if denom_factors:
-                        numer_str = '*'.join(str(f) for f in numer_factors) if numer_factors else '1'
-                        denom_str = '*'.join(str(f) for f in denom_factors)
-                        grad_meaning = f"{numer_str}/{denom_str}"
-                    else:
-                        grad_meaning = str(grad_simplified)
-                else:
-                    grad_meaning = str(grad_simplified)
-                grad_meaning = " ".join(grad_meaning.replace('**', '^').split())
-            else:
-                grad_meaning = "0"
-
-            int_meaning = " ".join(str(sp.simplify(const_term_original)).replace('**', '^').split()) if const_term_original != 0 else "0"
-
-            if original_eq.linearisation_type == "exponential" and original_eq.transform_info:
-                grad_meaning = original_eq.transform_info.get("gradient_meaning", grad_meaning)
-                int_meaning  = original_eq.transform_info.get("intercept_meaning", int_meaning)
-
-            if find_var:
-                if find_var in str(grad_coeff_original):
-                    grad_meaning += f" (contains {find_var})"
-                if find_var in str(const_term_original):
-                    int_meaning  += f" (contains {find_var})"
-            return grad_meaning, int_meaning
-        except Exception as e:
-            print(f"Error in _identify_meanings: {e}")
-            grad_meaning = "gradient"
-            int_meaning  = "y-intercept"
-            if original_eq.linearisation_type == "exponential" and original_eq.transform_info:
-                grad_meaning = original_eq.transform_info.get("gradient_meaning", "gradient")
-                int_meaning  = original_eq.transform_info.get("intercept_meaning", "y-intercept")
-            if find_var:
-                int_meaning += f" (can be used to find {find_var})"
-            return grad_meaning, int_meaning
+        """Extract physical meanings of the gradient and intercept (memoised)."""
+        return _identify_meanings_cached(linearised_eq, _equation_key(original_eq), x_var, y_var, find_var)
 
     def _display_linear_result(self, linearised_eq, x_var, y_var, find_var=None,
                                x_transform=None, y_transform=None,
                                grad_meaning=None, int_meaning=None):
         """Reveal the linearised result panel and populate it with equation and instructions."""
         self.linearised_display_frame.pack(fill="both", expand=True, pady=(10, 15))
-        self.linearised_equation_label.config(text=sp.pretty(linearised_eq, use_unicode=True))
+        self.linearised_equation_label.config(text=_pretty_eq(linearised_eq))
 
         x_transform  = x_transform  or x_var
         y_transform  = y_transform  or y_var
@@ -769,73 +967,8 @@ class AnalysisMethodScreen(tk.Frame):
             info_lines.append(f"\n\nYou can find {find_var} from the graph")
         self.linearised_info_label.config(text="\n".join(info_lines))
 
-    @staticmethod
-    def linearise(equation: sp.Eq) -> sp.Eq:
-        """Transform a SymPy equation into y = mx + c linear form (Algorithm 2)."""
-        x, y = sp.symbols("__linx__ __liny__")
-        if not isinstance(equation, sp.Eq):
-            expr = equation
-            if y in expr.free_symbols:
-                equation = sp.Eq(y, expr) if (expr.is_Add or expr.is_Mul or expr.is_Pow) else sp.Eq(expr, 0)
-            else:
-                equation = sp.Eq(y, expr)
-
-        lhs, rhs = equation.lhs, equation.rhs
-        if y in lhs.free_symbols and y not in rhs.free_symbols:
-            y_side, expr_side = lhs, rhs
-        elif y in rhs.free_symbols and y not in lhs.free_symbols:
-            y_side, expr_side = rhs, lhs
-        else:
-            return equation
-
-        # Pre-check: y**n = linear_in_x pattern (must run before the already-linear branch)
-        for _pw in (2, 3, 4):
-            _y_power = y ** _pw
-            if equation.has(_y_power):
-                _y_sub = sp.Symbol('_ysub_tmp_')
-                _eq_sub = equation.subs(_y_power, _y_sub)
-                if y not in _eq_sub.free_symbols:
-                    try:
-                        _sols = sp.solve(_eq_sub, _y_sub)
-                        if _sols:
-                            _cand = sp.expand(_sols[0])
-                            if _cand.is_polynomial(x) and sp.degree(_cand, x) <= 1:
-                                return sp.Eq(_y_power, _cand)
-                    except Exception:
-                        pass
-
-        if expr_side.is_polynomial(x) and sp.degree(expr_side, x) <= 1:
-            if y_side == y:
-                return equation
-            try:
-                solved = sp.solve(equation, y)
-                if solved:
-                    return sp.Eq(y, solved[0])
-            except Exception:
-                pass
-            return sp.Eq(y_side, expr_side)
-
-        if y_side != y:
-            try:
-                solved = sp.solve(equation, y)
-                if solved:
-                    expr_side = solved[0]
-                    y_side = y
-            except Exception:
-                pass
-
-        if expr_side.has(sp.exp):
-            exp_terms = [t for t in sp.preorder_traversal(expr_side) if isinstance(t, sp.exp)]
-            if exp_terms:
-                exp_term = exp_terms[0]
-                try:
-                    coefficient = sp.simplify(expr_side / exp_term)
-                    target = y_side if y_side == y else y_side
-                    return sp.Eq(sp.log(target), sp.log(coefficient) + exp_term.args[0])
-                except Exception:
-                    pass
-
-        return sp.Eq(y_side, expr_side)
+    # Exposed as a static method so existing callers keep using self.linearise(...).
+    linearise = staticmethod(_linearise)
 
     def _clear_placeholder(self, event):
         if self.search_entry.get() == self.search_placeholder:
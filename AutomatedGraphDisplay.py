@@ -1,70 +1,332 @@
 """AutomatedGraphDisplay.py — Screen 3b (Automated Curve Fitting) from Section 3.2.2."""
 
+import hashlib
+import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-from scipy.optimize import curve_fit
-from sklearn.metrics import r2_score
 from LineaX_Classes import InputData
-from GraphSettings import ChartElementsPopup, _DEFAULT_ELEMENT_STATES, _DEFAULT_LABEL_TEXTS, _fmt_coord
+from GraphSettings import ChartElementsPopup, _DEFAULT_ELEMENT_STATES, _DEFAULT_LABEL_TEXTS, _annotate_data_points
 from NumberFormatting import format_number
 from ManagingScreens import make_scrollable
 from typing import Optional, Dict
 
 
+def _jit(model):
+    """Compile a model function with numba.njit when numba is installed.
+
+    curve_fit calls each model hundreds of times per fit; compiled, each call is one fused
+    loop over x instead of a chain of NumPy temporaries. cache=True stores the machine
+    code on disk so later runs skip compilation. fastmath is left off because a diverging
+    fit must still produce inf/NaN for _r2_scores to reject it. Without numba the plain
+    NumPy function is returned unchanged.
+    """
+    try:
+        import numba
+    except ImportError:
+        return model
+    return numba.njit(cache=True)(model)
+
+
+@_jit
 def linear(x, a, b):
     return a * x + b
 
+@_jit
 def quadratic(x, a, b, c):
     return a * x**2 + b * x + c
 
+@_jit
 def cubic(x, a, b, c, d):
     return a * x**3 + b * x**2 + c * x + d
 
+@_jit
 def exponential_increase(x, a, b, c):
     return a * np.exp(b * x) + c
 
+@_jit
 def exponential_decrease(x, a, b, c):
     return a * np.exp(-b * x) + c
 
+@_jit
 def logarithmic(x, a, b, c):
-    x = np.array(x)
-    with np.errstate(divide='ignore', invalid='ignore'):
-        result = a * np.log(b * x) + c
-        result[np.isnan(result) | np.isinf(result) | (b * x <= 0)] = c
-    return result
-
+    # Points where b*x <= 0 fall back to c; clamping the log argument first means no
+    # NaN/-inf is produced, so no errstate is needed. Everything after b*x runs in place
+    # in one buffer rather than allocating a temporary per step.
+    bx = b * np.asarray(x)
+    out = np.maximum(bx, 1e-300)
+    np.log(out, out)
+    out *= a
+    out += c
+    out[~(bx > 0)] = c
+    return out
+
+@_jit
 def logistic(x, a, b, c):
     return c / (1 + np.exp(-(x - b) / a))
 
+@_jit
 def gaussian(x, a, b, c):
-    return a * np.exp(-((x - b)**2) / (2 * c**2))
-
+    # Evaluated in place in the x - b buffer, so one array is allocated instead of five.
+    out = x - b
+    out *= out
+    out /= -2 * c**2
+    np.exp(out, out)
+    out *= a
+    return out
+
+@_jit
 def sine(x, a, b, c, d):
     return a * np.sin(b * (x - c)) + d
 
 
+# Analytic Jacobians (∂model/∂params, one column per parameter) passed to curve_fit in
+# place of its finite-difference estimate. The exponentials are deliberately absent: forced
+# through near-linear data their exact Jacobian steers Levenberg-Marquardt into runaway
+# a·e^(bx) pairs that exhaust maxfev, where finite differences converge.
+def _logarithmic_jac(x, a, b, c):
+    bx = b * x
+    return np.column_stack((np.where(bx > 0, np.log(np.maximum(bx, 1e-300)), 0.0),
+                            np.where(bx > 0, a / b, 0.0), np.ones_like(x)))
+
+def _logistic_jac(x, a, b, c):
+    e = np.exp(-(x - b) / a)
+    g = c * e / (1 + e)**2
+    return np.column_stack((-g * (x - b) / a**2, -g / a, 1 / (1 + e)))
+
+def _gaussian_jac(x, a, b, c):
+    e = np.exp(-((x - b)**2) / (2 * c**2))
+    return np.column_stack((e, a * e * (x - b) / c**2, a * e * (x - b)**2 / c**3))
+
+def _sine_jac(x, a, b, c, d):
+    arg = b * (x - c)
+    slope = a * np.cos(arg)
+    return np.column_stack((np.sin(arg), slope * (x - c), -slope * b, np.ones_like(x)))
+
+
+_MODEL_JAC = {"Logarithmic": _logarithmic_jac, "Logistic": _logistic_jac,
+              "Gaussian": _gaussian_jac, "Sine": _sine_jac}
+
+# The polynomial models are linear in their parameters, so they are solved in closed form
+# by np.polyfit (a single least-squares solve) instead of iterating with curve_fit.
+# Values are the polynomial degree; polyfit returns coefficients highest power first,
+# which is the (a, b, c, d) order the model functions take.
+_POLY_DEGREE = {"Linear": 1, "Quadratic": 2, "Cubic": 3}
+
 _MODEL_P0 = {
-    "Linear": [1, 1], "Quadratic": [1, 1, 1], "Exponential Increase": [1, 1, 1],
-    "Exponential Decrease": [1, 1, 1], "Logarithmic": [1, 1, 1],
-    "Cubic": [1, 1, 1, 1], "Sine": [1, 1, 1, 1],
+    "Exponential Increase": [1, 1, 1], "Exponential Decrease": [1, 1, 1],
+    "Logarithmic": [1, 1, 1], "Sine": [1, 1, 1, 1],
+    # curve_fit's own default of all-ones, made explicit so the parameter count is never
+    # inferred by inspecting the (possibly numba-compiled) model's signature.
+    "Logistic": [1, 1, 1], "Gaussian": [1, 1, 1],
 }
 
+
+
+def _initial_guess(model_name: str, x: np.ndarray, y: np.ndarray) -> Optional[list]:
+    """Return a data-driven starting point for curve_fit, falling back to _MODEL_P0.
+
+    Starting every nonlinear model from all-ones leaves Levenberg-Marquardt far from
+    the basin of the true fit, so each guess below reads the obvious features of the
+    data: peak position and spread (Gaussian), midpoint and step height (Logistic),
+    dominant FFT frequency with a least-squares amplitude and phase (Sine) and a
+    log-linear fit of the offset data (exponentials).
+    """
+    fallback = _MODEL_P0.get(model_name)
+    y_min, y_max = float(y.min()), float(y.max())
+    y_span = y_max - y_min
+    x_span = float(x.max() - x.min())
+    if y_span == 0 or x_span == 0:
+        return fallback
+    try:
+        if model_name == "Gaussian":
+            peak = int(np.argmax(y))
+            # A maximum at either end of the x range is monotone data, not a peak to seed from.
+            if x[peak] in (x.min(), x.max()):
+                return fallback
+            return [y_max, float(x[peak]), float(np.std(x))]
+        if model_name == "Logistic":
+            order = np.argsort(x)
+            rising = y[order[-1]] >= y[order[0]]
+            midpoint = float(x[np.argmin(np.abs(y - (y_min + y_span / 2)))])
+            return [x_span / 10 if rising else -x_span / 10, midpoint, y_max]
+        if model_name == "Sine":
+            order = np.argsort(x)
+            n = len(x)
+            if n < 4:
+                return fallback
+            spectrum = np.abs(np.fft.rfft(y[order] - y.mean()))
+            freqs = np.fft.rfftfreq(n, d=x_span / (n - 1))
+            peak = int(np.argmax(spectrum[1:])) + 1
+            # A peak in the lowest bin (about one period across the data) is a trend rather
+            # than an oscillation, and its frequency is no guide to the fit.
+            if peak < 2:
+                return fallback
+            # The bin frequency is only accurate to half a bin, and the phase must match it,
+            # so for frequencies a half bin either side of the peak solve the linear problem
+            # y = p·sin(bx) + q·cos(bx) + d; since a·sin(b(x - c)) = a·cos(bc)·sin(bx) -
+            # a·sin(bc)·cos(bx), this gives a = hypot(p, q) and c = atan2(-q, p) / b.
+            # The candidate with the lowest residual is the starting point.
+            best, best_sse = fallback, np.inf
+            for offset in (-0.5, 0.0, 0.5):
+                b = 2 * np.pi * float(freqs[peak]) * (1 + offset / peak)
+                design = np.column_stack((np.sin(b * x), np.cos(b * x), np.ones_like(x)))
+                (p, q, d), residual, *_ = np.linalg.lstsq(design, y, rcond=None)
+                sse = float(residual[0]) if residual.size else 0.0
+                if sse < best_sse:
+                    best, best_sse = [float(np.hypot(p, q)), b, float(np.arctan2(-q, p)) / b, float(d)], sse
+            return best
+        if model_name in ("Exponential Increase", "Exponential Decrease"):
+            # Offset y just past its minimum (a > 0) or maximum (a < 0) so the log is defined,
+            # fit ln|y - c| = ln|a| + k·x, and keep the candidate whose rate has the sign the
+            # model expects (k > 0 for increase, k < 0 for decrease).
+            direction = 1 if model_name == "Exponential Increase" else -1
+            best, best_sse = fallback, np.inf
+            for sign in (1, -1):
+                c = y_min - 0.1 * y_span if sign > 0 else y_max + 0.1 * y_span
+                k, ln_a = np.polyfit(x, np.log(sign * (y - c)), 1)
+                if k * direction <= 0:
+                    continue
+                a = sign * float(np.exp(ln_a))
+                sse = float(np.sum((a * np.exp(k * x) + c - y) ** 2))
+                if sse < best_sse:
+                    best, best_sse = [a, direction * float(k), c], sse
+            return best
+    except (ValueError, FloatingPointError, np.linalg.LinAlgError):
+        return fallback
+    return fallback
+
+
+# Per-point deviation, relative to the largest |y|, below which _r2_scores treats a sum of
+# squares as zero: about a thousand ulps, well above the rounding a polynomial fit leaves.
+_R2_ZERO_TOL = 1e3 * np.finfo(float).eps
+
+
+def _r2_scores(y: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """Return R² = 1 − SS_res / SS_tot for every row of y_pred against y in one pass.
+
+    y_pred is the (n_models, n_points) matrix of fitted values, so all scores come from a
+    single broadcast. Mirrors sklearn.metrics.r2_score for 1-D data without importing
+    scikit-learn: a row containing NaN or infinity scores NaN (so the model is reported as
+    failed), and constant y scores 1.0 for a perfect fit and 0.0 otherwise.
+
+    "Constant" and "perfect" allow for rounding: a least-squares line through constant data
+    leaves residuals of a few ulps, so both sums of squares are compared against
+    _R2_ZERO_TOL relative to the largest |y| rather than tested for exact zero.
+    """
+    ss_res = ((y - y_pred) ** 2).sum(axis=1)
+    ss_tot = float(((y - y.mean()) ** 2).sum())
+    ss_zero = y.size * (_R2_ZERO_TOL * float(np.abs(y).max(initial=0.0))) ** 2
+    if ss_tot <= ss_zero:
+        r2 = np.where(np.isclose(ss_res, 0.0, rtol=0.0, atol=ss_zero), 1.0, 0.0)
+    else:
+        r2 = 1.0 - ss_res / ss_tot
+    r2[~np.isfinite(y_pred).all(axis=1)] = np.nan
+    return r2
+
+
+def _fit_bounds(model_name: str, x: np.ndarray) -> tuple:
+    """Return (lower, upper) parameter bounds for curve_fit.
+
+    Only the Logarithmic model is bounded: b takes the sign of the x data so b·x > 0
+    and every iterate stays where the log is defined. Outside that region the model is
+    clamped to c and has zero gradient in a and b, which stalls Levenberg-Marquardt.
+    Bounded fits use the slower trust-region reflective method, so every other model
+    returns the unbounded (-inf, inf), for which curve_fit keeps Levenberg-Marquardt.
+    """
+    if model_name == "Logarithmic":
+        inf = np.inf
+        if x.min() > 0:
+            return [-inf, 0, -inf], [inf, inf, inf]
+        if x.max() < 0:
+            return [-inf, -inf, -inf], [inf, 0, inf]
+    return -np.inf, np.inf
+
+
+# Datasets larger than this are fitted first on an evenly spaced subsample of this many
+# points, then refined on the full data with at most _REFINE_MAXFEV evaluations. Each
+# Levenberg-Marquardt step costs O(N), and a few thousand points already pin down three
+# or four parameters.
+_FIT_SAMPLE_SIZE = 2000
+_REFINE_MAXFEV = 500
+
+
+def _fit_model(model_name: str, model_func, x: np.ndarray, y: np.ndarray) -> tuple:
+    """Fit one model and return (params, y_pred), or (None, None) on failure.
+
+    R² is not scored here: fit_models scores every model at once with _r2_scores.
+    """
+    # Deferred so SciPy only loads once a fit is actually requested (see create_graph).
+    from scipy.optimize import curve_fit
+    try:
+        degree = _POLY_DEGREE.get(model_name)
+        if degree is not None:
+            # curve_fit refused under-determined fits; keep that rather than let polyfit
+            # return a rank-deficient solution that interpolates the data exactly.
+            if x.size <= degree:
+                return None, None
+            params = np.polyfit(x, y, degree)
+            return params, model_func(x, *params)
+        p0 = _initial_guess(model_name, x, y)
+        lower, upper = _fit_bounds(model_name, x)
+        if np.ndim(lower):
+            # The starting point must lie strictly inside the bounds.
+            lower, upper = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+            p0 = np.clip(np.ones_like(lower) if p0 is None else p0,
+                         np.nextafter(lower, upper), np.nextafter(upper, lower))
+        jac = _MODEL_JAC.get(model_name)
+        if x.size > _FIT_SAMPLE_SIZE:
+            # Converge on an evenly spaced subsample, then polish on the full data from there;
+            # if the polish runs out of evaluations the subsample fit stands.
+            idx = np.linspace(0, x.size - 1, _FIT_SAMPLE_SIZE).astype(np.int64)
+            p0, _ = curve_fit(model_func, x[idx], y[idx], p0=p0, bounds=(lower, upper),
+                              maxfev=10000, jac=jac)
+            try:
+                params, _ = curve_fit(model_func, x, y, p0=p0, bounds=(lower, upper),
+                                      maxfev=_REFINE_MAXFEV, jac=jac)
+            except RuntimeError:
+                params = p0
+        else:
+            params, _ = curve_fit(model_func, x, y, p0=p0, bounds=(lower, upper), maxfev=10000, jac=jac)
+        return params, model_func(x, *params)
+    except Exception:
+        return None, None
+
+
+# Equation display templates, as bound str.format methods taking the formatted parameters in order.
 _EQ_TEMPLATES = {
-    "Linear":               lambda p, f: f"y = {f(p[0])}x + {f(p[1])}",
-    "Quadratic":            lambda p, f: f"y = {f(p[0])}x^2 + {f(p[1])}x + {f(p[2])}",
-    "Cubic":                lambda p, f: f"y = {f(p[0])}x^3 + {f(p[1])}x^2 + {f(p[2])}x + {f(p[3])}",
-    "Exponential Increase": lambda p, f: f"y = {f(p[0])}e^({f(p[1])}x) + {f(p[2])}",
-    "Exponential Decrease": lambda p, f: f"y = {f(p[0])}e^(-{f(p[1])}x) + {f(p[2])}",
-    "Logarithmic":          lambda p, f: f"y = {f(p[0])}ln({f(p[1])}x) + {f(p[2])}",
-    "Logistic":             lambda p, f: f"y = {f(p[2])} / (1 + e^(-(x-{f(p[1])})/{f(p[0])}))",
-    "Gaussian":             lambda p, f: f"y = {f(p[0])}e^(-((x-{f(p[1])})^2/(2*{f(p[2])}^2)))",
-    "Sine":                 lambda p, f: f"y = {f(p[0])}sin({f(p[1])}(x-{f(p[2])})) + {f(p[3])}",
+    "Linear":               "y = {0}x + {1}".format,
+    "Quadratic":            "y = {0}x^2 + {1}x + {2}".format,
+    "Cubic":                "y = {0}x^3 + {1}x^2 + {2}x + {3}".format,
+    "Exponential Increase": "y = {0}e^({1}x) + {2}".format,
+    "Exponential Decrease": "y = {0}e^(-{1}x) + {2}".format,
+    "Logarithmic":          "y = {0}ln({1}x) + {2}".format,
+    "Logistic":             "y = {2} / (1 + e^(-(x-{1})/{0}))".format,
+    "Gaussian":             "y = {0}e^(-((x-{1})^2/(2*{2}^2)))".format,
+    "Sine":                 "y = {0}sin({1}(x-{2})) + {3}".format,
 }
 
 
+# Fit results for recently analysed datasets, keyed by a digest of the x and y data, as
+# (results, y_pred matrix, skipped models). The screen is recreated on every visit, so returning to it
+# with unchanged data reuses the fits instead of repeating them; the oldest entry is
+# dropped once _FIT_CACHE_SIZE datasets are held.
+_FIT_CACHE: Dict[bytes, tuple] = {}
+_FIT_CACHE_SIZE = 8
+
+# A Linear fit at or above this R² is taken as exact: the six nonlinear models are skipped
+# rather than fitted, and shown as such in the Model Selection panel.
+_PERFECT_LINEAR_R2 = 0.9999
+
+# Interval at which the Tk event loop checks whether the background model fits have finished.
+_FIT_POLL_MS = 50
+
+# Chart elements that change what is plotted, and so the autoscaled axis limits; toggling
+# one redraws the axes, while every other element is restyled in place.
+_PLOTTED_ELEMENTS = ('error_bars', 'best_fit')
+
+
 class AutomatedGraphResultsScreen(tk.Frame):
     """Screen 3b: automated curve fitting results with R² model comparison."""
 
@@ -73,24 +335,56 @@ class AutomatedGraphResultsScreen(tk.Frame):
         self.manager = manager
         self.parent = parent
         self.input_data: Optional[InputData] = None
+        # Contiguous float64 copies of the data and its x-range, prepared once on load.
+        self._x = self._y = None
+        self._x_range = (0.0, 0.0)
+        # Scratch array the size of the data, reused by calculate_rmse for the residuals.
+        self._residual_buf: Optional[np.ndarray] = None
+        # Future for the fit_models call running off the Tk thread (see _start_fitting).
+        self._fit_future = None
         self.models = {
             "Linear": linear, "Quadratic": quadratic, "Cubic": cubic,
             "Exponential Increase": exponential_increase, "Exponential Decrease": exponential_decrease,
             "Logarithmic": logarithmic, "Logistic": logistic, "Gaussian": gaussian, "Sine": sine,
         }
+        # model name -> (r2, params, y_pred); y_pred is the fitted curve at the data x values,
+        # kept so R² and RMSE never re-evaluate the model.
         self.results: Dict = {}
+        # (n_models, n_points) matrix of fitted values in self.models order; each results
+        # y_pred is a row view into it.
+        self._y_pred: Optional[np.ndarray] = None
+        # Models left unfitted because the Linear fit was already exact (see fit_models).
+        self._skipped_models: set = set()
+        # model name -> RMSE, filled lazily by calculate_rmse; data is fixed for the screen's lifetime.
+        self._rmse_cache: Dict[str, float] = {}
+        # Smooth x grid for fitted curves, and model name -> curve values on it, filled lazily.
+        self._x_smooth: Optional[np.ndarray] = None
+        self._y_smooth_cache: Dict[str, np.ndarray] = {}
+        # model name -> formatted equation string, built once per model by get_equation_text.
+        self._equation_text_cache: Dict[str, str] = {}
         self.best_model_name = self.best_model_params = self.selected_model = None
         self.figure = self.canvas = None
+        self._ax = None
+        # The fitted-curve Line2D, and the axes data limits before it was added, kept so a
+        # model switch can update the line in place (see _show_selected_fit).
+        self._fit_line = None
+        self._data_lim = None
+        # Data label annotations, created the first time labels are shown and then toggled.
+        self._data_label_artists: list = []
+        # Fit Statistics value StringVars (model, r2, rmse, equation), created with the panel rows.
+        self._stat_vars: Optional[Dict[str, tk.StringVar]] = None
         self.chart_elements_popup = None
         self.chart_element_states = {k: v for k, v in _DEFAULT_ELEMENT_STATES.items() if k != 'worst_fit'}
         self.chart_label_texts = dict(_DEFAULT_LABEL_TEXTS)
 
-        if self._load_data_and_analyze():
+        if self._load_data():
             self.create_layout()
+            self._start_fitting()
         else:
             self._create_error_layout()
 
-    def _load_data_and_analyze(self) -> bool:
+    def _load_data(self) -> bool:
+        """Validate the input data and prepare the arrays the fits and graph share."""
         self.input_data = self.manager.get_data()
         if self.input_data is None:
             messagebox.showerror("No Data", "No data found. Please go back and input your data.")
@@ -98,12 +392,46 @@ class AutomatedGraphResultsScreen(tk.Frame):
         if not len(getattr(self.input_data, 'x_values', [])):
             messagebox.showerror("Invalid Data", "The data does not contain valid x and y values.")
             return False
-        try:
-            self.fit_models()
-            return True
-        except Exception as e:
-            messagebox.showerror("Analysis Error", f"Could not perform curve fitting:\n{e}\n\nPlease check your data.")
+        self._x = np.ascontiguousarray(self.input_data.x_values, dtype=np.float64)
+        self._y = np.ascontiguousarray(self.input_data.y_values, dtype=np.float64)
+        # One finiteness pass here, rather than letting every model fail inside curve_fit.
+        if self._x.shape != self._y.shape or not (np.isfinite(self._x).all() and np.isfinite(self._y).all()):
+            messagebox.showerror("Invalid Data", "The x and y values must be finite numbers of equal length "
+                                                 "(no blank, NaN or infinite entries).")
             return False
+        self._x_range = (float(self._x.min()), float(self._x.max()))
+        self._x_smooth = np.linspace(*self._x_range, 200)
+        self._residual_buf = np.empty_like(self._y)
+        return True
+
+    def _start_fitting(self):
+        """Run fit_models on a worker thread so the screen appears while the models fit.
+
+        Tk is not thread-safe, so the worker only computes; _poll_fitting checks the
+        future from the Tk event loop via after() and fills in the results once it is done.
+        Until then the graph shows the data points alone.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._fit_future = executor.submit(self.fit_models)
+        executor.shutdown(wait=False)
+        self.after(_FIT_POLL_MS, self._poll_fitting)
+
+    def _poll_fitting(self):
+        if not self._fit_future.done():
+            self.after(_FIT_POLL_MS, self._poll_fitting)
+            return
+        error = self._fit_future.exception()
+        if error is not None:
+            messagebox.showerror("Analysis Error", f"Could not perform curve fitting:\n{error}\n\nPlease check your data.")
+            for widget in self.winfo_children():
+                widget.destroy()
+            self._create_error_layout()
+            return
+        if self.best_model_name:
+            self.subtitle_label.config(text=f"Best model: {self.best_model_name}")
+        self.refresh_graph()
+        self.update_statistics_display()
+        self.update_model_selection_display()
 
     def create_layout(self):
         self.configure(padx=20, pady=20)
@@ -157,137 +485,243 @@ class AutomatedGraphResultsScreen(tk.Frame):
             fill="x", padx=20, pady=(0, 20))
 
     def fit_models(self):
-        """Fit all nine models and identify the best by R² score (Algorithms 7 and 8)."""
-        x_data, y_data = self.input_data.x_values, self.input_data.y_values
+        """Fit all nine models and identify the best by R² score (Algorithms 7 and 8).
+
+        The polynomial fits run first; unless Linear already reaches _PERFECT_LINEAR_R2,
+        the independent nonlinear fits then run on a thread pool. Results are read back in
+        self.models order so ties for the best R² resolve exactly as before. Data seen
+        recently is served from _FIT_CACHE without refitting.
+        """
+        x_data, y_data = self._x, self._y
+        key = hashlib.blake2b(x_data.tobytes() + b'|' + y_data.tobytes(), digest_size=16).digest()
+        cached = _FIT_CACHE.get(key)
+        if cached is not None:
+            self.results, self._y_pred, self._skipped_models = cached
+        else:
+            # The polynomials are single least-squares solves, so they go first; if the
+            # straight line already fits essentially perfectly the nonlinear fits are skipped.
+            fits = {name: _fit_model(name, func, x_data, y_data)
+                    for name, func in self.models.items() if name in _POLY_DEGREE}
+            linear_params, linear_pred = fits.get("Linear", (None, None))
+            skip = (linear_params is not None
+                    and _r2_scores(y_data, linear_pred[np.newaxis])[0] >= _PERFECT_LINEAR_R2)
+            pending = [(name, func) for name, func in self.models.items() if name not in fits]
+            self._skipped_models = {name for name, _ in pending} if skip else set()
+            if pending and not skip:
+                workers = min(len(pending), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    fits.update(zip((name for name, _ in pending),
+                                    pool.map(lambda item: _fit_model(item[0], item[1], x_data, y_data), pending)))
+            fits = [fits.get(name, (None, None)) for name in self.models]
+            # One row of fitted values per model; failed or skipped fits stay NaN and so score NaN.
+            self._y_pred = np.full((len(fits), x_data.size), np.nan)
+            for row, (params, y_pred) in zip(self._y_pred, fits):
+                if params is not None:
+                    row[:] = y_pred
+            r2_scores = _r2_scores(y_data, self._y_pred)
+            self.results = {
+                model_name: (float(r2), params, y_pred) if not np.isnan(r2) else (None, None, None)
+                for model_name, (params, _), r2, y_pred in zip(self.models, fits, r2_scores, self._y_pred)
+            }
+            if len(_FIT_CACHE) >= _FIT_CACHE_SIZE:
+                del _FIT_CACHE[next(iter(_FIT_CACHE))]
+            _FIT_CACHE[key] = (self.results, self._y_pred, self._skipped_models)
         best_r2 = -np.inf
-        for model_name, model_func in self.models.items():
-            try:
-                p0 = _MODEL_P0.get(model_name)
-                params, _ = curve_fit(model_func, x_data, y_data, p0=p0, maxfev=10000)
-                r2 = r2_score(y_data, model_func(x_data, *params))
-                self.results[model_name] = (r2, params)
-                if r2 > best_r2:
-                    best_r2, self.best_model_name, self.best_model_params = r2, model_name, params
-            except Exception:
-                self.results[model_name] = (None, None)
+        for model_name, (r2, params, _) in self.results.items():
+            if r2 is not None and r2 > best_r2:
+                best_r2, self.best_model_name, self.best_model_params = r2, model_name, params
         self.selected_model = self.best_model_name
 
     def create_graph(self):
-        """Draw data points and the selected model's fitted curve."""
+        """Create the figure and its Tk canvas, and draw the graph into them."""
         if self.input_data is None:
             tk.Label(self.graph_frame, text="[Graph Display Area]",
                      font=("Segoe UI", 12), fg="#94a3b8", bg="white", justify="center").pack(expand=True)
             return
 
+        # Matplotlib is imported here rather than at module level so it is only loaded once
+        # a graph is actually drawn, not whenever this module is imported.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(8, 5), dpi=100, facecolor='white')
+        self._draw_graph()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_frame)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    def _draw_graph(self):
+        """Draw data points and the selected model's fitted curve into the (empty) figure."""
         states = self.chart_element_states
-        self.figure = plt.Figure(figsize=(8, 5), dpi=100, facecolor='white')
-        ax = self.figure.add_subplot(111)
-        x, y = self.input_data.x_values, self.input_data.y_values
+        ax = self._ax = self.figure.add_subplot(111)
+        x, y = self._x, self._y
+        self._data_label_artists = []
+        self._fit_line = None
 
         ax.errorbar(x, y,
                     xerr=self.input_data.x_error if states['error_bars'] else None,
                     yerr=self.input_data.y_error if states['error_bars'] else None,
                     fmt='o', color='#3b82f6', ecolor='#94a3b8', capsize=4, markersize=6,
-                    label='Data points' if states['legend'] else '', zorder=3)
-
-        if states.get('data_labels'):
-            for xi, yi in zip(x, y):
-                ax.annotate(f'({_fmt_coord(xi)}, {_fmt_coord(yi)})', (xi, yi),
-                            textcoords="offset points", xytext=(0, 10), ha='center', fontsize=7,
-                            color='#334155', bbox=dict(boxstyle='round,pad=0.2', facecolor='white',
-                                                       alpha=0.75, edgecolor='none'))
+                    label='Data points', zorder=3)
+        self._data_lim = ax.dataLim.frozen()
 
         current_model = self.selected_model or self.best_model_name
         if current_model and current_model in self.results and states['best_fit']:
-            r2, params = self.results[current_model]
-            if r2 is not None:
-                x_smooth = np.linspace(x.min(), x.max(), 200)
-                ax.plot(x_smooth, self.models[current_model](x_smooth, *params), color='#10b981',
-                        linewidth=2, label=f'{current_model} fit' if states['legend'] else '', zorder=2)
-
-        if states.get('chart_title'):
-            ax.set_title(self.chart_label_texts.get('chart_title') or "Automated Curve Fitting",
-                         fontsize=13, fontweight='bold', pad=15)
-        if states.get('axis_titles'):
-            ax.set_xlabel(self.chart_label_texts.get('x_title') or self.input_data.x_title or "X",
-                          fontsize=11, fontweight='bold')
-            ax.set_ylabel(self.chart_label_texts.get('y_title') or self.input_data.y_title or "Y",
-                          fontsize=11, fontweight='bold')
+            if self.results[current_model][0] is not None:
+                self._fit_line, = ax.plot(self._x_smooth, self._smooth_curve(current_model), color='#10b981',
+                                          linewidth=2, label=f'{current_model} fit', zorder=2)
+
+        self._apply_chart_elements()
+
+    def _smooth_curve(self, model_name: str) -> np.ndarray:
+        """Return model_name's fitted curve on the smooth x grid, evaluated once per model."""
+        y_smooth = self._y_smooth_cache.get(model_name)
+        if y_smooth is None:
+            params = self.results[model_name][1]
+            y_smooth = self._y_smooth_cache[model_name] = self.models[model_name](self._x_smooth, *params)
+        return y_smooth
+
+    def _show_selected_fit(self):
+        """Swap the existing fit line to the selected model's curve without redrawing the axes.
+
+        The data limits captured in create_graph (data points and error bars only) are
+        restored before adding the new curve's extent, so the axes rescale exactly as a
+        fresh create_graph would. The legend is recreated to pick up the new label.
+        """
+        ax = self._ax
+        y_smooth = self._smooth_curve(self.selected_model)
+        self._fit_line.set_ydata(y_smooth)
+        self._fit_line.set_label(f'{self.selected_model} fit')
+        ax.dataLim.set(self._data_lim)
+        ax.update_datalim(np.column_stack((self._x_smooth, y_smooth)))
+        ax.autoscale_view()
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+            ax.legend(loc='best', framealpha=0.9, fontsize=9)
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def _apply_chart_elements(self):
+        """Apply the decorative chart element states to the existing axes in place.
+
+        Covers everything except the plotted data itself (see _PLOTTED_ELEMENTS), so a
+        toggle here only restyles artists and never redraws the axes.
+        """
+        states = self.chart_element_states
+        ax = self._ax
+
+        show_labels = bool(states.get('data_labels'))
+        if show_labels and not self._data_label_artists:
+            self._data_label_artists = _annotate_data_points(ax, self._x, self._y)
+        for label in self._data_label_artists:
+            label.set_visible(show_labels)
+
+        ax.set_title((self.chart_label_texts.get('chart_title') or "Automated Curve Fitting")
+                     if states.get('chart_title') else '', fontsize=13, fontweight='bold', pad=15)
+        show_axis_titles = states.get('axis_titles')
+        ax.set_xlabel((self.chart_label_texts.get('x_title') or self.input_data.x_title or "X")
+                      if show_axis_titles else '', fontsize=11, fontweight='bold')
+        ax.set_ylabel((self.chart_label_texts.get('y_title') or self.input_data.y_title or "Y")
+                      if show_axis_titles else '', fontsize=11, fontweight='bold')
+        # grid() re-enables the grid whenever line properties are passed, so styling is
+        # only supplied when switching a grid on.
         if states.get('major_gridlines'):
             ax.grid(True, which='major', alpha=0.35, linestyle='--', linewidth=0.6)
+        else:
+            ax.grid(False, which='major')
         if states.get('minor_gridlines'):
             ax.minorticks_on()
             ax.grid(True, which='minor', alpha=0.18, linestyle=':', linewidth=0.4)
-        if states['legend']:
+        else:
+            ax.minorticks_off()
+            ax.grid(False, which='minor')
+        legend = ax.get_legend()
+        if states['legend'] and legend is None:
             ax.legend(loc='best', framealpha=0.9, fontsize=9)
-        if not states['axes']:
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-            ax.tick_params(left=False, bottom=False)
+        elif not states['legend'] and legend is not None:
+            legend.remove()
+        for spine in ax.spines.values():
+            spine.set_visible(states['axes'])
+        ax.tick_params(left=states['axes'], bottom=states['axes'])
 
         self.figure.tight_layout()
-        self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
     def create_results_panels(self, parent):
-        """Create Fit Statistics and Model Selection panels."""
+        """Create the Fit Statistics and Model Selection panels, filled by _poll_fitting."""
         stats_frame = tk.LabelFrame(parent, text="  Fit Statistics  ", font=("Segoe UI", 10, "bold"),
                                     bg="white", fg="#059669", relief="solid", bd=2)
         stats_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
         self.stats_content = tk.Frame(stats_frame, bg="white")
         self.stats_content.pack(fill="both", expand=True, padx=15, pady=10)
-        self.update_statistics_display()
 
         model_frame = tk.LabelFrame(parent, text="  Model Selection  ", font=("Segoe UI", 10, "bold"),
                                     bg="white", fg="#2563eb", relief="solid", bd=2)
         model_frame.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
         self.model_content = tk.Frame(model_frame, bg="white")
         self.model_content.pack(fill="both", expand=True, padx=15, pady=10)
-        self.update_model_selection_display()
 
     def update_statistics_display(self):
-        """Refresh the Fit Statistics panel for the current model."""
-        for widget in self.stats_content.winfo_children():
-            widget.destroy()
+        """Refresh the Fit Statistics panel for the current model.
+
+        The rows are built on the first call; each later call (one per model selection)
+        only sets their StringVars rather than destroying and recreating the labels.
+        """
         current_model = self.selected_model or self.best_model_name
         if not current_model or current_model not in self.results:
             return
         r2_value = self.results[current_model][0]
         rmse_value = self.calculate_rmse()
-        self.create_stat_label(self.stats_content, "Model:", current_model)
-        self.create_stat_label(self.stats_content, "R value:",
-                               format_number(r2_value, 6) if r2_value is not None else "N/A")
-        self.create_stat_label(self.stats_content, "RMSE:",
-                               format_number(rmse_value) if rmse_value is not None else "N/A")
-        tk.Label(self.stats_content, text="Equation:", font=("Segoe UI", 9), bg="white",
-                 fg="#475569", anchor="w").pack(anchor="w", pady=(10, 2))
-        tk.Label(self.stats_content, text=self.get_equation_text(), font=("Segoe UI", 9, "bold"),
-                 bg="white", fg="#0f172a", wraplength=250, justify="left").pack(anchor="w")
-
-    def create_stat_label(self, parent, label_text: str, value_text: str):
+        if self._stat_vars is None:
+            self._stat_vars = {
+                'model': self.create_stat_label(self.stats_content, "Model:"),
+                'r2': self.create_stat_label(self.stats_content, "R value:"),
+                'rmse': self.create_stat_label(self.stats_content, "RMSE:"),
+                'equation': tk.StringVar(),
+            }
+            tk.Label(self.stats_content, text="Equation:", font=("Segoe UI", 9), bg="white",
+                     fg="#475569", anchor="w").pack(anchor="w", pady=(10, 2))
+            tk.Label(self.stats_content, textvariable=self._stat_vars['equation'], font=("Segoe UI", 9, "bold"),
+                     bg="white", fg="#0f172a", wraplength=250, justify="left").pack(anchor="w")
+        self._stat_vars['model'].set(current_model)
+        self._stat_vars['r2'].set(format_number(r2_value, 6) if r2_value is not None else "N/A")
+        self._stat_vars['rmse'].set(format_number(rmse_value) if rmse_value is not None else "N/A")
+        self._stat_vars['equation'].set(self.get_equation_text())
+
+    def create_stat_label(self, parent, label_text: str) -> tk.StringVar:
+        """Add a 'label: value' row to parent and return the StringVar holding its value."""
+        value_var = tk.StringVar()
         row = tk.Frame(parent, bg="white")
         row.pack(fill="x", pady=2)
         tk.Label(row, text=label_text, font=("Segoe UI", 9), bg="white", fg="#475569", anchor="w").pack(side="left")
-        tk.Label(row, text=value_text, font=("Segoe UI", 9, "bold"), bg="white", fg="#0f172a", anchor="e").pack(side="right")
+        tk.Label(row, textvariable=value_var, font=("Segoe UI", 9, "bold"), bg="white", fg="#0f172a", anchor="e").pack(side="right")
+        return value_var
 
     def calculate_rmse(self) -> Optional[float]:
         """Calculate RMSE for the currently selected model."""
         current_model = self.selected_model or self.best_model_name
         if current_model not in self.results or self.results[current_model][0] is None:
             return None
-        params = self.results[current_model][1]
-        y_pred = self.models[current_model](self.input_data.x_values, *params)
-        return float(np.sqrt(np.mean((self.input_data.y_values - y_pred) ** 2)))
+        rmse = self._rmse_cache.get(current_model)
+        if rmse is None:
+            # Residuals are squared in place in the preallocated scratch buffer.
+            residuals = np.subtract(self._y, self.results[current_model][2], out=self._residual_buf)
+            np.square(residuals, out=residuals)
+            rmse = self._rmse_cache[current_model] = float(np.sqrt(residuals.mean()))
+        return rmse
 
     def get_equation_text(self) -> str:
         """Return a formatted equation string for the current model and fitted parameters."""
         current_model = self.selected_model or self.best_model_name
         if current_model not in self.results or self.results[current_model][0] is None:
             return "N/A"
-        params = self.results[current_model][1]
-        template = _EQ_TEMPLATES.get(current_model)
-        return template(params, lambda v: format_number(v, 3)) if template else "Complex equation"
+        text = self._equation_text_cache.get(current_model)
+        if text is None:
+            params = self.results[current_model][1]
+            template = _EQ_TEMPLATES.get(current_model)
+            text = template(*(format_number(v, 3) for v in params)) if template else "Complex equation"
+            self._equation_text_cache[current_model] = text
+        return text
 
     def update_model_selection_display(self):
         """Refresh the Model Selection panel with radio buttons and R² scores."""
@@ -308,14 +742,19 @@ class AutomatedGraphResultsScreen(tk.Frame):
                 tk.Label(row, text=f"R² = {format_number(result[0], 4)}", font=("Segoe UI", 9, "bold"),
                          bg="white", fg="#2563eb").pack(side="right", anchor="e")
             else:
-                tk.Label(row, text=f"{model_name}: Error", font=("Segoe UI", 9),
+                status = "Skipped (linear fit exact)" if model_name in self._skipped_models else "Error"
+                tk.Label(row, text=f"{model_name}: {status}", font=("Segoe UI", 9),
                          bg="white", fg="#94a3b8").pack(side="left", anchor="w")
 
     def on_model_selected(self):
         self.selected_model = self.model_var.get()
         self.subtitle_label.config(text=f"Selected model: {self.selected_model}")
         self.update_statistics_display()
-        self.refresh_graph()
+        # With a fit line on screen only its data changes; otherwise redraw the graph.
+        if self._fit_line is not None:
+            self._show_selected_fit()
+        else:
+            self.refresh_graph()
 
     def open_chart_elements(self):
         if self.chart_elements_popup is not None:
@@ -339,17 +778,25 @@ class AutomatedGraphResultsScreen(tk.Frame):
         self.chart_elements_popup.protocol("WM_DELETE_WINDOW", _on_close)
 
     def update_chart_elements(self, states: Dict[str, bool], label_texts: Optional[Dict[str, str]] = None):
+        """Apply new chart element states, redrawing the axes only if the plotted data changes."""
+        data_changed = any(states.get(k) != self.chart_element_states.get(k) for k in _PLOTTED_ELEMENTS)
         self.chart_element_states = states
         if label_texts is not None:
             self.chart_label_texts = label_texts
-        self.refresh_graph()
+        if data_changed or self.canvas is None:
+            self.refresh_graph()
+            return
+        self._apply_chart_elements()
+        self.canvas.draw_idle()
 
     def refresh_graph(self):
-        if self.canvas:
-            self.canvas.get_tk_widget().destroy()
-        if self.figure:
-            plt.close(self.figure)
-        self.create_graph()
+        """Redraw the graph, clearing and reusing the existing figure and Tk canvas if there is one."""
+        if self.canvas is None:
+            self.create_graph()
+            return
+        self.figure.clear()
+        self._draw_graph()
+        self.canvas.draw_idle()
 
     def export_results(self):
         if self.figure is None:
@@ -19,6 +19,21 @@ import tkinter as tk
 # messagebox displays modal info/warning/error dialogs to the user.
 from tkinter import ttk, filedialog, messagebox
 
+# re compiles the number patterns validate_entry checks each cell against.
+import re
+
+# os.stat supplies the modification time and size that identify a file version in _HEADER_CACHE.
+import os
+
+# Path splits the chosen file path into name and suffix on any platform's separators.
+from pathlib import Path
+
+# ThreadPoolExecutor runs the file read on a worker thread so the Tk event loop stays responsive.
+from concurrent.futures import ThreadPoolExecutor
+
+# numpy holds the manual entry grid as one array so blank and invalid cells are found in one pass.
+import numpy as np
+
 # pandas is the data analysis library used to read CSV and Excel files into
 # DataFrames before the user maps columns to x, y and error axes.
 import pandas as pd
@@ -26,15 +41,36 @@ import pandas as pd
 # InputData is the core data container populated here and passed to all downstream screens.
 from LineaX_Classes import InputData
 
-# AnalysisMethodScreen is Screen 2; the navigation target after successful data validation.
-from AnalysisMethod import AnalysisMethodScreen
-
 # ScreenManager manages screen transitions; make_scrollable wraps panels in a scrollable canvas.
 from ManagingScreens import make_scrollable, ScreenManager
 
 # Column header labels for the manual entry grid (Section 3.2.1, Branch 2).
 _MANUAL_HEADERS = ["X / Independent", "X Error", "Y / Dependent", "Y Error"]
 
+# Tk widget classes that accept state, bg and fg together; set_panel_state restyles only
+# these (Frames, LabelFrames and ttk widgets reject at least one of the three options).
+_STATEFUL_CLASSES = frozenset({"Button", "Entry", "Label"})
+
+# Header DataFrames of recently opened files, keyed by (path, mtime, size) so an edited
+# file is read again. The oldest entry is dropped once _HEADER_CACHE_SIZE files are held.
+_HEADER_CACHE = {}
+_HEADER_CACHE_SIZE = 4
+
+# Excel formats openpyxl can open; _read_header names the engine for these directly.
+_OPENPYXL_SUFFIXES = (".xlsx", ".xlsm")
+
+# Milliseconds between checks on the background file read started by select_file.
+_LOAD_POLL_MS = 50
+
+# Milliseconds a manual entry cell must be left alone before validate_entry runs on it.
+_VALIDATE_DELAY_MS = 100
+
+# re.ASCII limits \d to 0-9, matching what pd.to_numeric in get_manual_data accepts.
+# A complete decimal or scientific-notation number, e.g. '12', '-0.5', '.5', '3.', '6.02e23'.
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?", re.ASCII)
+# The start of a number still being typed, e.g. '-', '.', '1e', '2.5E-'; shown uncoloured.
+_PARTIAL_NUMBER_RE = re.compile(r"[+-]?\.?|[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?", re.ASCII)
+
 
 def _btn(parent, text, command, bg="#0f172a", fg="white", font_size=10, bold=True, **kwargs) -> tk.Button:
     """Factory for consistently styled flat buttons used throughout Screen 1.
@@ -48,6 +84,49 @@ def _btn(parent, text, command, bg="#0f172a", fg="white", font_size=10, bold=Tru
                      bg=bg, fg=fg, relief="flat", cursor="hand2", command=command, **kwargs)
 
 
+# Shared focus handlers for the header entries; each entry carries its own placeholder
+# text as _placeholder, so no per-entry closures are created.
+def _clear_placeholder(event):
+    """Clear placeholder text when an entry gains focus."""
+    if event.widget.get() == event.widget._placeholder:
+        event.widget.delete(0, tk.END)
+        event.widget.config(fg="#0f172a")
+
+
+def _restore_placeholder(event):
+    """Restore placeholder text when an entry loses focus while empty."""
+    if not event.widget.get().strip():
+        event.widget.insert(0, event.widget._placeholder)
+        event.widget.config(fg="#94a3b8")
+
+
+def _read_header(path: Path, is_csv: bool) -> pd.DataFrame:
+    """Read only the header row of a CSV or Excel file.
+
+    nrows=0 stops the parser after the column names, so populate_columns can fill the
+    dropdowns without loading any data. The mapped columns alone are read later by
+    InputData.read_csv_file / read_excel when the user clicks 'Next'. .xlsx headers
+    are read with openpyxl, named explicitly so pandas skips sniffing the file format:
+    it opens the workbook read-only and streams rows, so it stops after the first one,
+    whereas calamine parses the whole sheet. Other Excel formats keep pandas' default.
+    Re-opening an unchanged file is served from _HEADER_CACHE without touching its contents.
+    """
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    header = _HEADER_CACHE.get(key)
+    if header is not None:
+        return header
+    if is_csv:
+        header = pd.read_csv(path, nrows=0)
+    else:
+        engine = "openpyxl" if path.suffix.lower() in _OPENPYXL_SUFFIXES else None
+        header = pd.read_excel(path, nrows=0, engine=engine)
+    if len(_HEADER_CACHE) >= _HEADER_CACHE_SIZE:
+        del _HEADER_CACHE[next(iter(_HEADER_CACHE))]
+    _HEADER_CACHE[key] = header
+    return header
+
+
 class DataInputScreen(tk.Frame):
     """Screen 1: data import (Branch 1) and manual entry (Branch 2).
 
@@ -60,8 +139,13 @@ class DataInputScreen(tk.Frame):
         super().__init__(parent, bg="#f5f6f8", padx=20, pady=15)
         self.manager = manager
         self.parent = parent
-        self.df = None        # pandas DataFrame loaded from the selected file
-        self.filepath = None  # path of the loaded file, used to choose read_csv vs read_excel
+        self.df = None        # header-only pandas DataFrame of the selected file
+        self.filepath = None  # pathlib.Path of the loaded file
+        self._is_csv = False  # whether filepath has a .csv suffix, choosing read_csv vs read_excel
+        self._col_idx = {}    # column name shown in the dropdowns -> 1-based file column index
+        self._load_future = None  # pending background read started by select_file
+        self._panel_enabled = {}  # panel -> state last applied by set_panel_state
+        self._panel_widgets = {}  # panel -> flat list of its restylable descendant widgets
         self.input_data = None
         self.create_layout()
 
@@ -113,12 +197,10 @@ class DataInputScreen(tk.Frame):
         tk.Label(panel, text="Import Excel/CSV Files", font=("Segoe UI", 13, "bold"),
                  bg="white", fg="#0f172a").pack(anchor="w", pady=(0, 15))
 
-        # Progress bar: shown during file loading, hidden after 300 ms via parent.after().
+        # Progress bar: animated while the file is read in the background, hidden once it finishes.
         self.progress_frame = tk.Frame(panel, bg="white")
-        self.progress_var = tk.DoubleVar(value=0)
-        self.progress = ttk.Progressbar(self.progress_frame, mode="determinate",
-                                        length=320, maximum=100, variable=self.progress_var)
-        self.progress_label = tk.Label(self.progress_frame, text="0%",
+        self.progress = ttk.Progressbar(self.progress_frame, mode="indeterminate", length=320)
+        self.progress_label = tk.Label(self.progress_frame, text="Loading...",
                                        font=("Segoe UI", 9), bg="white", fg="#475569")
         self.progress.pack()
         self.progress_label.pack(pady=(2, 0))
@@ -168,76 +250,87 @@ class DataInputScreen(tk.Frame):
                  fg="#94a3b8", bg="white").pack(anchor="w", pady=(8, 0))
 
     def select_file(self):
-        """Open the OS file chooser and load the selected CSV or Excel file.
+        """Open the OS file chooser and start loading the selected CSV or Excel file.
 
         filedialog.askopenfilename opens the native OS file picker, filtered to
         CSV and Excel types, returning the chosen path or empty string if cancelled.
-        pd.read_csv / pd.read_excel (pandas) parse the file into a DataFrame; the
-        column names are then used to populate the four Combobox dropdowns.
-        parent.after(300, ...) schedules the progress bar to be hidden 300 ms after
-        loading completes, giving the user brief visual feedback of completion.
-        Satisfies success criterion 1.1.2.
+        The indeterminate progress bar animates while _start_loading reads the file
+        in the background. Satisfies success criterion 1.1.2.
         """
+        if self._load_future is not None:
+            return
         path = filedialog.askopenfilename(
             title="Select Data File",
             filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
         )
         if not path:
             return
-        self.filepath = path
-        self._set_progress(0)
+        path = Path(path)
         self.progress_frame.pack(pady=5, before=self.drop_zone.master)
-        self.parent.update()
-        try:
-            self._set_progress(30)
-            # pandas automatically detects the file format from the extension.
-            self.df = pd.read_csv(path) if path.endswith(".csv") else pd.read_excel(path)
-            self._set_progress(70)
-            self.drop_label.config(text=f"✓ {path.split('/')[-1]}", fg="#10b981", font=("Segoe UI", 10, "bold"))
-            self.populate_columns()
-            self._set_progress(100)
-            # Disable manual entry panel while a file is loaded to prevent conflicting input.
-            self.set_panel_state(self.manual_panel, enabled=False)
-            self.remove_file_btn.place(relx=1, rely=0, anchor="ne")
-        except Exception as e:
-            self.df = None
-            self.filepath = None
-            messagebox.showerror("File Error", str(e))
-        finally:
-            # Hide progress bar after a short delay regardless of success or failure.
-            self.parent.after(300, self.progress_frame.pack_forget)
+        self.progress.start(50)
+        self._start_loading(path)
 
-    def _set_progress(self, value: int):
-        """Update the progress bar value and label text.
+    def _start_loading(self, path: Path):
+        """Read the file's header with _read_header on a worker thread.
 
-        self.parent.update() forces an immediate Tkinter redraw so the progress
-        bar appears to animate during sequential calls within select_file().
+        Tk is not thread-safe, so the worker only parses the file; _poll_loading checks
+        the future from the Tk event loop via after() and updates the widgets once it is done.
         """
-        self.progress_var.set(value)
-        self.progress_label.config(text=f"{value}%")
-        self.parent.update()
+        is_csv = path.suffix.lower() == ".csv"
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._load_future = executor.submit(_read_header, path, is_csv)
+        executor.shutdown(wait=False)
+        self.after(_LOAD_POLL_MS, self._poll_loading, path, is_csv)
+
+    def _poll_loading(self, path: Path, is_csv: bool):
+        if not self._load_future.done():
+            self.after(_LOAD_POLL_MS, self._poll_loading, path, is_csv)
+            return
+        future, self._load_future = self._load_future, None
+        self.progress.stop()
+        self.progress_frame.pack_forget()
+        error = future.exception()
+        if error is not None:
+            self.df = None
+            self.filepath = None
+            messagebox.showerror("File Error", str(error))
+            return
+        self.filepath = path
+        self._is_csv = is_csv
+        self.df = future.result()
+        self.drop_label.config(text=f"✓ {path.name}", fg="#10b981", font=("Segoe UI", 10, "bold"))
+        self.populate_columns()
+        # Disable manual entry panel while a file is loaded to prevent conflicting input.
+        self.set_panel_state(self.manual_panel, enabled=False)
+        self.remove_file_btn.place(relx=1, rely=0, anchor="ne")
 
     def populate_columns(self):
         """Populate the four Combobox dropdowns after a file is loaded.
 
         Sets the first two file columns as the default x and y selections,
         matching the most common layout of a two-column data file.
-        Displays the row and column count to confirm the import was successful.
+        Displays the column count to confirm the import was successful.
+        _col_idx maps each name, as the Combobox returns it, to its 1-based column
+        index so collect_file_data does not scan the column list.
         """
         if self.df is None:
             return
-        cols = list(self.df.columns)
+        cols = tuple(self.df.columns)
+        self._col_idx = {}
+        for i, name in enumerate(cols, start=1):
+            self._col_idx.setdefault(str(name), i)   # first column wins, as list.index did
+        # Each values tuple is built once and shared by the pair of dropdowns that show it.
+        none_cols = ("None", *cols)
         self.x_col["values"] = cols
         self.y_col["values"] = cols
-        self.x_err_col["values"] = ["None"] + cols
-        self.y_err_col["values"] = ["None"] + cols
+        self.x_err_col["values"] = none_cols
+        self.y_err_col["values"] = none_cols
         if cols:
             self.x_col.set(cols[0])
         if len(cols) >= 2:
             self.y_col.set(cols[1])
         messagebox.showinfo("Success",
-                            f"File loaded successfully!\n\nRows: {len(self.df)}\n"
-                            f"Columns: {len(cols)}\n\nPlease verify column mappings below.")
+                            f"File loaded successfully!\n\nColumns: {len(cols)}\n\nPlease verify column mappings below.")
 
     def collect_file_data(self):
         """Collect data from the imported file into self.input_data.
@@ -253,15 +346,15 @@ class DataInputScreen(tk.Frame):
         y_col_name = self.y_col.get()
         if not x_col_name or not y_col_name:
             raise ValueError("Please select both X and Y columns.")
-        cols = list(self.df.columns)
-        x_idx = cols.index(x_col_name) + 1
-        y_idx = cols.index(y_col_name) + 1
+        col_idx = self._col_idx
+        x_idx = col_idx[x_col_name]
+        y_idx = col_idx[y_col_name]
         x_err_name = self.x_err_col.get()
         y_err_name = self.y_err_col.get()
-        x_err_idx = cols.index(x_err_name) + 1 if x_err_name != "None" else None
-        y_err_idx = cols.index(y_err_name) + 1 if y_err_name != "None" else None
+        x_err_idx = col_idx[x_err_name] if x_err_name != "None" else None
+        y_err_idx = col_idx[y_err_name] if y_err_name != "None" else None
         self.input_data = InputData()
-        if self.filepath.endswith('.csv'):
+        if self._is_csv:
             self.input_data.read_csv_file(self.filepath, x_idx, y_idx, x_err_idx, y_err_idx)
         else:
             self.input_data.read_excel(self.filepath, x_idx, y_idx, x_err_idx, y_err_idx)
@@ -279,10 +372,11 @@ class DataInputScreen(tk.Frame):
         manual_data = self.get_manual_data()
         if manual_data is None:
             raise ValueError("Please enter valid numeric data in at least one row.")
-        x_vals = [v for v in manual_data["X"] if v is not None]
-        y_vals = [v for v in manual_data["Y"] if v is not None]
-        x_err_vals = [v for v in manual_data["X_err"] if v is not None] or None
-        y_err_vals = [v for v in manual_data["Y_err"] if v is not None] or None
+        # Blank cells are NaN in get_manual_data's arrays; ~np.isnan keeps the filled ones.
+        filled = {key: col[~np.isnan(col)] for key, col in manual_data.items()}
+        x_vals, y_vals = filled["X"], filled["Y"]
+        x_err_vals = filled["X_err"] if filled["X_err"].size else None
+        y_err_vals = filled["Y_err"] if filled["Y_err"].size else None
         if len(x_vals) != len(y_vals):
             raise ValueError("X and Y must have the same number of values.")
         if len(x_vals) < 3:
@@ -319,12 +413,20 @@ class DataInputScreen(tk.Frame):
             e.insert(0, text)
             e.grid(row=0, column=col, padx=1, pady=1, sticky="ew")
             # FocusIn/FocusOut bindings implement placeholder text behaviour.
-            e.bind("<FocusIn>",  lambda ev, t=text: self.clear_placeholder(ev, t))
-            e.bind("<FocusOut>", lambda ev, t=text: self.restore_placeholder(ev, t))
+            e._placeholder = text
+            e.bind("<FocusIn>",  _clear_placeholder)
+            e.bind("<FocusOut>", _restore_placeholder)
             self.header_entries.append(e)
 
-        # Data rows: 7 initial rows, expandable via Add Row button.
+        # Every data cell carries the _entry_tag bind tag, so one <KeyRelease> binding on the
+        # tag serves the whole grid. The widget path makes the tag unique to this screen.
+        self._entry_tag = f"{self}.NumericEntry"
+        self.bind_class(self._entry_tag, "<KeyRelease>", self._schedule_validation)
+
+        # Data rows: 7 initial rows, expandable via Add Row button. self.entries holds the
+        # visible rows; rows removed by delete_row wait in _row_pool for add_row to reuse.
         self.entries = [self._make_entry_row(table_frame, row) for row in range(1, 8)]
+        self._row_pool = []
 
         # Warning banner indicating that error columns are optional.
         info_frame = tk.Frame(panel, bg="#fef3c7", relief="solid", bd=1)
@@ -345,27 +447,43 @@ class DataInputScreen(tk.Frame):
     def _make_entry_row(self, table_frame: tk.Frame, row: int) -> list:
         """Create and grid four tk.Entry widgets for a data row.
 
-        Each entry has a <KeyRelease> binding to validate_entry so the cell background
-        updates to green (#f0fdf4) for valid numbers or red (#fee2e2) for invalid input
-        on every keystroke (success criterion 1.1.4).
+        Each entry gets the screen's _entry_tag bind tag, whose <KeyRelease> binding calls
+        _schedule_validation, so the cell background updates to green (#f0fdf4) for valid
+        numbers or red (#fee2e2) for invalid input as soon as typing pauses
+        (success criterion 1.1.4).
         """
         row_entries = []
         for col in range(4):
             entry = tk.Entry(table_frame, font=("Segoe UI", 9), width=12,
                              justify="center", relief="solid", bd=1)
             entry.grid(row=row, column=col, padx=1, pady=1, sticky="ew")
-            entry.bind("<KeyRelease>", lambda e: self.validate_entry(e.widget))
+            entry.bindtags(entry.bindtags() + (self._entry_tag,))
             row_entries.append(entry)
         return row_entries
 
+    def _schedule_validation(self, event):
+        """Debounce validate_entry so a burst of keystrokes or a paste validates once.
+
+        Each key release cancels the cell's pending after() callback and schedules a new
+        one _VALIDATE_DELAY_MS later, so validation runs only once typing settles.
+        """
+        widget = event.widget
+        pending = getattr(widget, "_validate_after_id", None)
+        if pending is not None:
+            widget.after_cancel(pending)
+        widget._validate_after_id = widget.after(_VALIDATE_DELAY_MS, self.validate_entry, widget)
+
     def validate_entry(self, entry_widget):
-        """Colour-code entry cells on each keystroke: green for valid float, red for invalid.
+        """Colour-code an entry cell once typing pauses: green for a number, red for invalid.
 
-        float() is used to test whether the cell content is numeric; a ValueError
-        indicates invalid input and triggers the red background.
-        If a file has been loaded, manual entry is blocked by immediately clearing
+        _NUMBER_RE.fullmatch tests whether the cell content is a complete number without
+        raising and catching a ValueError; anything else triggers the red background,
+        except a number still being typed (_PARTIAL_NUMBER_RE), which stays white rather
+        than flashing red. The background is only reconfigured when the colour changes.
+        If a file has been loaded, manual entry is blocked by clearing
         any typed character (mutually exclusive input paths, Section 3.2.1).
         """
+        entry_widget._validate_after_id = None
         if self.df is None and entry_widget.get().strip():
             # Disable the import panel once manual typing starts.
             self.set_panel_state(self.import_panel, enabled=False)
@@ -373,56 +491,77 @@ class DataInputScreen(tk.Frame):
             entry_widget.delete(0, tk.END)
             return
         value = entry_widget.get().strip()
-        if not value:
-            entry_widget.config(bg="white")
-            return
-        try:
-            float(value)
-            entry_widget.config(bg="#f0fdf4")   # green: valid number
-        except ValueError:
-            entry_widget.config(bg="#fee2e2")   # red: non-numeric input
+        if _NUMBER_RE.fullmatch(value):
+            colour = "#f0fdf4"   # green: valid number
+        elif _PARTIAL_NUMBER_RE.fullmatch(value):
+            colour = "white"     # blank, or a number still being typed
+        else:
+            colour = "#fee2e2"   # red: non-numeric input
+        if entry_widget.cget("bg") != colour:
+            entry_widget.config(bg=colour)
 
     def add_row(self):
-        """Append a new data row to the manual entry grid."""
+        """Append a new data row to the manual entry grid.
+
+        A row hidden by delete_row is re-gridded if one is available; grid() with no
+        arguments restores its remembered position. New Entry widgets are only created
+        when the pool is empty.
+        """
+        if self._row_pool:
+            row_entries = self._row_pool.pop()
+            for entry in row_entries:
+                entry.grid()
+            self.entries.append(row_entries)
+            return
         table_frame = self.entries[0][0].master
         self.entries.append(self._make_entry_row(table_frame, len(self.entries) + 1))
+        self._panel_widgets.pop(self.manual_panel, None)
 
     def delete_row(self):
         """Remove the last row from the manual entry grid.
 
         A minimum of three rows is enforced because Algorithm 1 (linear regression,
         Section 3.2.2) requires at least three data points for a meaningful fit.
-        widget.destroy() removes the Entry widget from both the grid and memory.
+        grid_remove() hides the cleared row's Entry widgets without destroying them, and
+        the row is kept in _row_pool so add_row can show it again.
         """
         if len(self.entries) <= 3:
             messagebox.showwarning("Minimum Rows", "At least three rows must remain.")
             return
-        for entry in self.entries.pop():
-            entry.destroy()
+        row_entries = self.entries.pop()
+        for entry in row_entries:
+            # Cancel a pending validation so it does not recolour the cleared cell.
+            if getattr(entry, "_validate_after_id", None) is not None:
+                entry.after_cancel(entry._validate_after_id)
+                entry._validate_after_id = None
+            entry.delete(0, tk.END)
+            entry.config(bg="white")
+            entry.grid_remove()
+        self._row_pool.append(row_entries)
 
     def get_manual_data(self):
-        """Extract numeric values from the manual entry grid into a dict of lists.
-
-        Iterates over all rows; any row that is entirely blank is skipped. A single
-        non-numeric cell in a non-blank row causes None to be returned, signalling
-        invalid input to collect_manual_data().
+        """Extract numeric values from the manual entry grid into a dict of float arrays.
+
+        The stripped cell strings are gathered into one (rows × 4) string array. Fully
+        blank rows are skipped. Every non-blank cell must match _NUMBER_RE, the pattern
+        validate_entry colours green; otherwise None is returned, signalling invalid input
+        to collect_manual_data(). Blank cells become 'nan' and the whole array is converted
+        with astype(float), which rounds each string exactly as float() does, so
+        resolution() (Algorithm 3) sees the same values as the typed text.
         Returns None if no file has been loaded but df is not None (defensive guard).
         """
         if self.df is not None:
             return None
-        data = {"X": [], "Y": [], "X_err": [], "Y_err": []}
-        for row_entries in self.entries:
-            x_val, x_err, y_val, y_err = (e.get().strip() for e in row_entries)
-            if not any((x_val, x_err, y_val, y_err)):
-                continue    # skip fully blank rows
-            try:
-                data["X"].append(float(x_val) if x_val else None)
-                data["Y"].append(float(y_val) if y_val else None)
-                data["X_err"].append(float(x_err) if x_err else None)
-                data["Y_err"].append(float(y_err) if y_err else None)
-            except ValueError:
-                return None
-        return data if data["X"] else None
+        cells = np.array([[e.get().strip() for e in row_entries] for row_entries in self.entries], dtype=str)
+        blank = cells == ""
+        cells, blank = cells[~blank.all(axis=1)], blank[~blank.all(axis=1)]    # skip fully blank rows
+        if not len(cells):
+            return None
+        if not all(_NUMBER_RE.fullmatch(cell) for cell in cells[~blank]):
+            return None
+        values = np.where(blank, "nan", cells).astype(float)
+        x_val, x_err, y_val, y_err = values.T
+        return {"X": x_val, "Y": y_val, "X_err": x_err, "Y_err": y_err}
 
     def proceed_to_next(self):
         """Validate input, store InputData in ScreenManager, and navigate to Screen 2.
@@ -440,22 +579,14 @@ class DataInputScreen(tk.Frame):
                 self.collect_manual_data()
             self.manager.set_data(self.input_data)
             messagebox.showinfo("Data Validated", "Data validated successfully. Proceeding to analysis.")
+            # AnalysisMethodScreen is Screen 2. It is imported here rather than at module
+            # level because it pulls in SymPy; deferring the import keeps it off Screen 1's
+            # start-up path.
+            from AnalysisMethod import AnalysisMethodScreen
             self.manager.show(AnalysisMethodScreen)
         except Exception as e:
             messagebox.showerror("Data Error", str(e))
 
-    def clear_placeholder(self, event, text: str):
-        """Clear placeholder text when an entry gains focus."""
-        if event.widget.get() == text:
-            event.widget.delete(0, tk.END)
-            event.widget.config(fg="#0f172a")
-
-    def restore_placeholder(self, event, text: str):
-        """Restore placeholder text when an entry loses focus while empty."""
-        if not event.widget.get().strip():
-            event.widget.insert(0, text)
-            event.widget.config(fg="#94a3b8")
-
     def _reset_file_state(self):
         """Clear loaded file state and reset all four Combobox selectors to empty."""
         self.df = None
@@ -482,6 +613,7 @@ class DataInputScreen(tk.Frame):
             entry.insert(0, text)
         messagebox.showinfo("Reset Complete", "All inputs have been cleared.")
         self.set_panel_state(self.import_panel, enabled=True)
+        self.set_panel_state(self.manual_panel, enabled=True)
 
     def remove_imported_file(self):
         """Remove the currently loaded file and re-enable the manual entry panel."""
@@ -494,29 +626,43 @@ class DataInputScreen(tk.Frame):
         self.set_panel_state(self.manual_panel, enabled=True)
 
     def set_panel_state(self, panel, enabled: bool):
-        """Recursively enable or disable all widgets in a panel.
+        """Enable or disable all widgets in a panel.
 
         Changing bg and fg gives a visual greyed-out appearance for disabled panels,
         clearly communicating to the user which pathway is currently active
         (success criterion 1.1.4).
-        winfo_children() returns all direct children of a widget; the recursive
-        _update_widget_state call propagates the state change to nested frames.
+        The restylable widgets come from _stateful_widgets, so a toggle is one flat loop
+        with a single config call per widget and no TclError handling; asking for the
+        state a panel is already in returns immediately, as validate_entry does on every
+        pause in typing.
         """
+        if self._panel_enabled.get(panel) == enabled:
+            return
+        self._panel_enabled[panel] = enabled
+        state = "normal" if enabled else "disabled"
         bg = "white" if enabled else "#e5e7eb"
         fg = "#0f172a" if enabled else "#9ca3af"
         panel.config(bg=bg)
-        for widget in panel.winfo_children():
-            self._update_widget_state(widget, enabled, bg, fg)
+        for widget in self._stateful_widgets(panel):
+            widget.config(state=state, bg=bg, fg=fg)
 
-    def _update_widget_state(self, widget, enabled: bool, bg: str, fg: str):
-        """Apply state, bg and fg to a single widget, ignoring unsupported options via TclError."""
-        try:
-            widget.config(state="normal" if enabled else "disabled", bg=bg, fg=fg)
-        except tk.TclError:
-            pass
-        for child in widget.winfo_children():
-            self._update_widget_state(child, enabled, bg, fg)
+    def _stateful_widgets(self, panel) -> list:
+        """Return the widgets nested inside panel whose Tk class is in _STATEFUL_CLASSES.
 
+        winfo_children() returns the direct children of a widget; an explicit stack replaces
+        recursion, and winfo_class() is checked once here rather than on every toggle.
+        The list is cached; add_row drops the manual panel's entry so it is rebuilt.
+        """
+        widgets = self._panel_widgets.get(panel)
+        if widgets is None:
+            widgets, stack = [], list(panel.winfo_children())
+            while stack:
+                widget = stack.pop()
+                if widget.winfo_class() in _STATEFUL_CLASSES:
+                    widgets.append(widget)
+                stack.extend(widget.winfo_children())
+            self._panel_widgets[panel] = widgets
+        return widgets
 
 if __name__ == "__main__":
     # Standalone launch for layout testing without running the full application.
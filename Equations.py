@@ -12,7 +12,8 @@ a searchable physics equation library for OCR A-Level Physics A).
 
 # dataclass generates __init__, __repr__ and __eq__ automatically; frozen=True makes
 # the instance immutable (hashable) so Equation objects can safely be stored in sets.
-from dataclasses import dataclass
+# field declares name_folded as derived (init=False) rather than a constructor argument.
+from dataclasses import dataclass, field
 
 # Dict, List, Set, Optional, Tuple are standard type hint aliases from typing.
 from typing import Dict, List, Set, Optional, Tuple
@@ -58,18 +59,22 @@ class Equation:
                             'reciprocal', 'quadratic' or 'power'
       transform_info      — pre-computed gradient/intercept meanings for exponential equations,
                             used by _identify_meanings in AnalysisMethodScreen
+      name_folded         — name.casefold(), computed once at catalogue load for keyword
+                            matching (e.g. gradient unit hints in AnalysisMethodScreen)
     """
     name: str
     expression: str
     variables: Dict[str, str]
     linearisation_type: Optional[str] = None
     transform_info: Optional[Dict[str, str]] = None
+    name_folded: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # object.__setattr__ is required here because frozen=True normally forbids attribute
         # assignment; this sets the default for transform_info after dataclass __init__ runs.
         if self.transform_info is None:
             object.__setattr__(self, 'transform_info', {})
+        object.__setattr__(self, 'name_folded', self.name.casefold())
 
 
 class ScientificEquation:
@@ -4,6 +4,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
+
 _DEFAULT_ELEMENT_STATES: Dict[str, bool] = {
     'axes': True, 'axis_titles': True, 'chart_title': True,
     'data_labels': False, 'error_bars': True, 'major_gridlines': True,
@@ -24,11 +26,51 @@ _ELEMENT_LABELS = [
 _KEYS_WITH_ENTRIES = {'axis_titles', 'chart_title'}
 
 
+# Most data labels drawn on one graph; larger datasets label an evenly spaced subset, since
+# each label is a separate Text artist with its own bbox patch redrawn on every canvas draw.
+_MAX_DATA_LABELS = 50
+
+
 def _fmt_coord(v: float) -> str:
     """Format a float to at most 5 decimal places, stripping trailing zeros."""
     return f"{v:.5f}".rstrip('0').rstrip('.')
 
 
+def _annotate_data_points(ax, x, y) -> list:
+    """Label data points with their (x, y) coordinates and return the created Text artists.
+
+    Every point is labelled up to _MAX_DATA_LABELS; beyond that np.linspace picks an evenly
+    spaced subset (always including the first and last points), keeping the artist count
+    bounded as the dataset grows.
+    """
+    n = len(x)
+    indices = range(n) if n <= _MAX_DATA_LABELS else np.linspace(0, n - 1, _MAX_DATA_LABELS).round().astype(int)
+    bbox = dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.75, edgecolor='none')
+    return [
+        ax.annotate(f'({_fmt_coord(x[i])}, {_fmt_coord(y[i])})', (x[i], y[i]),
+                    textcoords="offset points", xytext=(0, 10), ha='center', fontsize=7,
+                    color='#334155', bbox=bbox)
+        for i in indices
+    ]
+
+
+def _set_row_bg(widget, bg: str):
+    """Colour a checkbox row: the event widget is either the row frame or its checkbox."""
+    row = widget if isinstance(widget, tk.Frame) else widget.master
+    row.config(bg=bg)
+    for child in row.children.values():
+        child.config(bg=bg)
+
+
+# Shared hover handlers bound to every checkbox row, so no per-row closures are created.
+def _hover_in(event):
+    _set_row_bg(event.widget, "#e5f3ff")
+
+
+def _hover_out(event):
+    _set_row_bg(event.widget, "white")
+
+
 class ChartElementsPopup(tk.Toplevel):
     """Excel-style chart customisation popup with checkboxes and inline label editors."""
 
@@ -105,10 +147,9 @@ class ChartElementsPopup(tk.Toplevel):
 
     def _hover(self, item_frame, checkbox):
         """Bind hover highlight events to a row frame and its checkbox."""
-        item_frame.bind("<Enter>", lambda e: [item_frame.config(bg="#e5f3ff"), checkbox.config(bg="#e5f3ff")])
-        item_frame.bind("<Leave>", lambda e: [item_frame.config(bg="white"), checkbox.config(bg="white")])
-        checkbox.bind("<Enter>", lambda e: [item_frame.config(bg="#e5f3ff"), checkbox.config(bg="#e5f3ff")])
-        checkbox.bind("<Leave>", lambda e: [item_frame.config(bg="white"), checkbox.config(bg="white")])
+        for widget in (item_frame, checkbox):
+            widget.bind("<Enter>", _hover_in)
+            widget.bind("<Leave>", _hover_out)
 
     def create_checkbox_item(self, parent, key: str, label: str):
         """Standard toggle row with hover highlight."""
@@ -271,13 +312,7 @@ class ChartCustomisationMixin:
     def apply_chart_customisation(self, ax, x, y, states: Dict[str, bool], default_chart_title: str = ""):
         """Apply all chart customisation to an existing Matplotlib Axes object."""
         if states.get('data_labels'):
-            for xi, yi in zip(x, y):
-                ax.annotate(
-                    f'({_fmt_coord(xi)}, {_fmt_coord(yi)})',
-                    (xi, yi), textcoords="offset points", xytext=(0, 10),
-                    ha='center', fontsize=7, color='#334155',
-                    bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.75, edgecolor='none'),
-                )
+            _annotate_data_points(ax, x, y)
         if states.get('major_gridlines'):
             ax.grid(True, which='major', alpha=0.35, linestyle='--', linewidth=0.6)
         if states.get('minor_gridlines'):
@@ -13,9 +13,14 @@ are implemented as module-level functions and called by InputData._populate.
 # any concrete Graph subclass must implement calculate_coeffs().
 from abc import ABC, abstractmethod
 
-# csv is the standard library CSV reader used by InputData.read_csv_file.
+# csv is the standard library CSV reader; used to read the header row of a CSV file
+# so the mapped columns can be named after pyarrow has selected them by position.
 import csv
 
+# importlib.util.find_spec checks whether the optional python-calamine Excel engine
+# is installed without importing it.
+import importlib.util
+
 # Decimal provides arbitrary-precision decimal arithmetic; used in Algorithm 3
 # to inspect the number of decimal places in a float without floating-point rounding errors.
 from decimal import Decimal
@@ -31,6 +36,57 @@ from typing import List, Optional, Dict
 # DataFrame objects before extraction into InputData.
 import pandas as pd
 
+# python-calamine parses whole workbooks several times faster and in far less memory
+# than openpyxl's DOM; None leaves pandas on its default engine when it is missing.
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+
+def _column_positions(*columns) -> List[int]:
+    """Return the sorted zero-based positions of the mapped 1-based columns, skipping None."""
+    return sorted({c - 1 for c in columns if c is not None})
+
+
+def _read_csv_columns(filepath, positions: List[int]) -> pd.DataFrame:
+    """Read only the columns at the given zero-based positions of a CSV file as float64.
+
+    pyarrow.csv tokenises the file in parallel blocks and include_columns skips every
+    unmapped column; to_pandas(self_destruct=True) hands the Arrow buffers to pandas
+    without keeping a second copy. Columns are selected by position, not by header
+    text: the header row is read with csv.reader (utf-8-sig drops an Excel BOM) and
+    skipped, each column is named by its index so repeated headers stay distinct, and
+    the result is renamed back to the header text. Without pyarrow, pd.read_csv
+    (usecols=...) is used, memory-mapping the file so the C tokenizer reads straight
+    from the page cache; float_precision='round_trip' makes it round each value as
+    float() does, which resolution() (Algorithm 3) depends on. Either way the columns
+    come back in file order. Declaring every column float64 skips type inference; a
+    non-numeric cell raises an error naming the bad value.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(filepath, usecols=positions, dtype=np.float64, engine="c",
+                           float_precision="round_trip", memory_map=True)
+    with open(filepath, newline='', encoding="utf-8-sig") as file:
+        header = next(csv.reader(file))
+    names = [str(p) for p in positions]
+    table = pa_csv.read_csv(
+        filepath,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=1 << 20, skip_rows=1,
+                                        column_names=[str(i) for i in range(len(header))]),
+        convert_options=pa_csv.ConvertOptions(include_columns=names,
+                                              column_types={name: pa.float64() for name in names}),
+    )
+    return table.to_pandas(split_blocks=True, self_destruct=True).set_axis([header[p] for p in positions], axis=1)
+
+
+def _read_excel_columns(filepath, positions: List[int]) -> pd.DataFrame:
+    """Read only the columns at the given zero-based positions of an Excel file.
+
+    Uses the python-calamine engine when it is installed (_EXCEL_ENGINE).
+    """
+    return pd.read_excel(filepath, usecols=positions, engine=_EXCEL_ENGINE)
+
 
 def resolution(num) -> Decimal:
     """Return the measurement resolution of a number (Algorithm 3, Section 3.2.2).
@@ -57,13 +113,24 @@ def find_error(inputs: list, axis_err=None) -> np.ndarray:
     np.full creates an array of a given length filled with a constant value.
     """
     if axis_err is not None:
-        return np.array(axis_err)
+        return np.array(axis_err, dtype=float)
 
     # min() over a generator applies resolution() to every value and returns the smallest.
     min_res = float(min(resolution(v) for v in inputs))
     return np.full(len(inputs), min_res)
 
 
+def _checked(column: pd.Series) -> pd.Series:
+    """Raise ValueError if a file column has empty cells, which pandas reads as NaN.
+
+    resolution() (Algorithm 3) cannot take the decimal exponent of NaN, so a gap in
+    the file is reported by column name instead of failing inside Algorithm 3.
+    """
+    if column.isna().any():
+        raise ValueError(f"Column '{column.name}' has empty cells.")
+    return column
+
+
 class InputData:
     """Container for experimental values: x/y data, errors and axis titles.
 
@@ -107,33 +174,36 @@ class InputData:
     def read_excel(self, filepath, x: int, y: int, x_err_col=None, y_err_col=None):
         """Populate InputData from an Excel file using 1-based column indices.
 
-        pd.read_excel uses the openpyxl library to parse .xlsx/.xls files into a
-        DataFrame. df.iloc[:, col - 1] selects a column by zero-based integer position.
-        Column headers become x_title and y_title for graph axis labelling.
+        Only the mapped x, y and error columns are parsed (_read_excel_columns), so the
+        cost of the read does not grow with the width of the sheet. df.iloc selects each
+        column by its position among those read. Column headers become x_title and
+        y_title for graph axis labelling.
         Satisfies success criterion 1.1.2 (the application must accept Excel input).
         """
-        df = pd.read_excel(filepath)
+        positions = _column_positions(x, y, x_err_col, y_err_col)
+        df = _read_excel_columns(filepath, positions)
+        column = lambda col: df.iloc[:, positions.index(col - 1)]
         # Lambda converts each cell to int if it is already an integer, otherwise float,
         # preserving the original precision for Algorithm 3.
-        to_num = lambda col: [int(v) if isinstance(v, int) else float(v) for v in df.iloc[:, col - 1]]
-        self._populate(to_num(x), to_num(y), df.columns[x - 1], df.columns[y - 1], x_err_col, y_err_col)
+        to_num = lambda col: [int(v) if isinstance(v, int) else float(v) for v in _checked(column(col))]
+        self._populate(to_num(x), to_num(y), column(x).name, column(y).name,
+                       to_num(x_err_col) if x_err_col is not None else None,
+                       to_num(y_err_col) if y_err_col is not None else None)
 
     def read_csv_file(self, filepath, x_col: int, y_col: int, x_err_col=None, y_err_col=None):
         """Populate InputData from a CSV file using 1-based column indices.
 
-        csv.reader from the standard library parses comma-separated text; next(reader)
-        reads the header row to extract axis titles. Each subsequent row is parsed
-        to float for x and y values. Satisfies success criterion 1.1.2.
+        Only the mapped x, y and error columns are parsed (_read_csv_columns); the header
+        row supplies the axis titles. Every value is parsed straight to float64, as in a
+        plain text file there is no separate integer cell type. Satisfies success criterion 1.1.2.
         """
-        x_data, y_data = [], []
-        with open(filepath, newline='') as file:
-            reader = csv.reader(file)
-            header = next(reader, None)
-            x_title, y_title = header[x_col - 1], header[y_col - 1]
-            for row in reader:
-                x_data.append(float(row[x_col - 1]))
-                y_data.append(float(row[y_col - 1]))
-        self._populate(x_data, y_data, x_title, y_title, x_err_col, y_err_col)
+        positions = _column_positions(x_col, y_col, x_err_col, y_err_col)
+        df = _read_csv_columns(filepath, positions)
+        column = lambda col: df.iloc[:, positions.index(col - 1)]
+        to_num = lambda col: _checked(column(col)).tolist()
+        self._populate(to_num(x_col), to_num(y_col), column(x_col).name, column(y_col).name,
+                       to_num(x_err_col) if x_err_col is not None else None,
+                       to_num(y_err_col) if y_err_col is not None else None)
 
     def get_manual_data(self, x_vals, y_vals, x_err_vals=None, y_err_vals=None, x_title=None, y_title=None):
         """Populate InputData from values entered manually in Screen 1 (Branch 2).
@@ -7,7 +7,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 from LineaX_Classes import InputData, LinearGraph
 from ManagingScreens import make_scrollable, ScreenManager
-from GraphSettings import ChartElementsPopup, _DEFAULT_ELEMENT_STATES, _DEFAULT_LABEL_TEXTS, _fmt_coord
+from GraphSettings import ChartElementsPopup, _DEFAULT_ELEMENT_STATES, _DEFAULT_LABEL_TEXTS, _annotate_data_points
 from GradientAnalysis import GradientAnalysisScreen
 from NumberFormatting import format_number, format_number_with_uncertainty
 from typing import Optional, Dict
@@ -147,11 +147,7 @@ class LinearGraphResultsScreen(tk.Frame):
                     label='Data points' if states['legend'] else '', zorder=3)
 
         if states.get('data_labels'):
-            for xi, yi in zip(x, y):
-                ax.annotate(f'({_fmt_coord(xi)}, {_fmt_coord(yi)})', (xi, yi),
-                            textcoords="offset points", xytext=(0, 10), ha='center', fontsize=7,
-                            color='#334155', bbox=dict(boxstyle='round,pad=0.2', facecolor='white',
-                                                       alpha=0.75, edgecolor='none'))
+            _annotate_data_points(ax, x, y)
 
         if states['best_fit']:
             x_line = np.linspace(x[0], x[-1], 100)
@@ -0,0 +1,55 @@
+"""Tests that InputData.read_csv_file parses values exactly as float() does."""
+
+import csv
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from LineaX_Classes import InputData
+
+
+@pytest.fixture
+def scientific_csv(tmp_path):
+    rng = random.Random(0)
+    rows = [[f"{rng.uniform(1, 10):.{rng.randint(1, 8)}f}e{rng.randint(-40, 40)}" for _ in range(3)]
+            for _ in range(2000)]
+    rows[0] = ["6.5467e-19", "1.2345e-33", "2.2e-308"]
+    path = tmp_path / "values.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["x", "junk", "y"])
+        writer.writerows(rows)
+    return path, rows
+
+
+def _check(path, rows):
+    data = InputData()
+    data.read_csv_file(path, 1, 3, 2)
+    assert data.x_values.tolist() == [float(row[0]) for row in rows]
+    assert data.y_values.tolist() == [float(row[2]) for row in rows]
+    assert data.x_error.tolist() == [float(row[1]) for row in rows]
+    return data
+
+
+def test_pandas_path_matches_float(scientific_csv, monkeypatch):
+    # A None entry in sys.modules makes `import pyarrow` raise ImportError.
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    _check(*scientific_csv)
+
+
+def test_pyarrow_path_matches_float(scientific_csv):
+    pytest.importorskip("pyarrow")
+    _check(*scientific_csv)
+
+
+def test_default_error_uses_typed_resolution(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    path = tmp_path / "small.csv"
+    path.write_text("x,y\n6.5467e-19,1\n1.5e-19,2\n2.25e-19,3\n")
+    data = InputData()
+    data.read_csv_file(path, 1, 2)
+    assert data.x_error.tolist() == [1e-23] * 3
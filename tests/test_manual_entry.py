@@ -0,0 +1,48 @@
+"""Tests for DataInputScreen.get_manual_data parsing of the manual entry grid."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DataInput import DataInputScreen
+
+
+class _Entry:
+    """Minimal stand-in for tk.Entry exposing only get()."""
+
+    def __init__(self, text):
+        self._text = text
+
+    def get(self):
+        return self._text
+
+
+def _screen(rows):
+    # get_manual_data only reads df and entries, so no Tk window is needed.
+    screen = DataInputScreen.__new__(DataInputScreen)
+    screen.df = None
+    screen.entries = [[_Entry(text) for text in row] for row in rows]
+    return screen
+
+
+def test_scientific_notation_matches_float():
+    xs = ["6.5467e-19", "1.2345E+7", "-3.0001e-5", ".5e2", "7."]
+    ys = ["2.2e-308", "9.87654321e-3", "1e22", "4.44e-16", "+0.1"]
+    data = _screen([[x, "", y, ""] for x, y in zip(xs, ys)]).get_manual_data()
+    assert data["X"].tolist() == [float(s) for s in xs]
+    assert data["Y"].tolist() == [float(s) for s in ys]
+
+
+@pytest.mark.parametrize("cell", ["abc", "1..2", "inf", "nan", "١"])
+def test_invalid_cell_returns_none(cell):
+    assert _screen([["1", "", "2", ""], [cell, "", "3", ""]]).get_manual_data() is None
+
+
+def test_blank_rows_skipped_and_blank_cells_nan():
+    data = _screen([["1", "", "2", "0.1"], ["", "", "", ""], ["3", "", "4", "0.2"]]).get_manual_data()
+    assert data["X"].tolist() == [1.0, 3.0]
+    assert data["Y_err"].tolist() == [0.1, 0.2]
+    assert all(v != v for v in data["X_err"])
@@ -0,0 +1,48 @@
+"""Tests for R² scoring and best-model selection in AutomatedGraphDisplay."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import AutomatedGraphDisplay as agd
+
+
+def _screen(x, y):
+    # fit_models only reads models, _x and _y, so no Tk window is needed.
+    screen = agd.AutomatedGraphResultsScreen.__new__(agd.AutomatedGraphResultsScreen)
+    screen.models = {
+        "Linear": agd.linear, "Quadratic": agd.quadratic, "Cubic": agd.cubic,
+        "Exponential Increase": agd.exponential_increase, "Exponential Decrease": agd.exponential_decrease,
+        "Logarithmic": agd.logarithmic, "Logistic": agd.logistic, "Gaussian": agd.gaussian, "Sine": agd.sine,
+    }
+    screen._x, screen._y = x, y
+    return screen
+
+
+@pytest.mark.parametrize("value", [3.7, 0.1, -2.5, 1e-19, 6.02e23])
+@pytest.mark.parametrize("n", [5, 50, 3000])
+def test_constant_y_selects_linear(value, n):
+    screen = _screen(np.linspace(1.0, 10.0, n), np.full(n, value))
+    screen.fit_models()
+    assert screen.results["Linear"][0] == 1.0
+    assert screen.best_model_name == "Linear"
+
+
+def test_constant_y_rounding_residual_scores_perfect():
+    y = np.full(50, 0.1)
+    y_pred = np.vstack([y + 1e-17, y + 1e-3])
+    assert list(agd._r2_scores(y, y_pred)) == [1.0, 0.0]
+
+
+def test_varying_y_scores_match_definition():
+    y = np.array([1.0, 2.0, 4.0, 8.0])
+    y_pred = np.vstack([y, y + 0.5, np.full(4, np.nan)])
+    r2 = agd._r2_scores(y, y_pred)
+    ss_tot = ((y - y.mean()) ** 2).sum()
+    assert r2[0] == 1.0
+    assert r2[1] == pytest.approx(1.0 - 4 * 0.25 / ss_tot)
+    assert np.isnan(r2[2])